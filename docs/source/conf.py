@@ -3,6 +3,17 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+import hashlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from docutils import nodes
+from docutils.parsers.rst import Directive, directives
+
+import vspec_vsm
+
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
@@ -14,6 +25,10 @@ release = "0.3.7"
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
+# ``VSM_FAST_DOCS=1`` is for quick rebuilds while editing the prose: the API
+# reference is not generated and the gallery examples are not executed.
+FAST = os.environ.get('VSM_FAST_DOCS') == '1'
+
 extensions = [
     'sphinx.ext.napoleon',
     'sphinx_automodapi.automodapi',
@@ -25,14 +40,130 @@ extensions = [
     'sphinxcontrib.bibtex',
     'sphinx.ext.todo',
 ]
+if FAST:
+    extensions = [ext for ext in extensions if ext not in (
+        'sphinx_automodapi.automodapi',
+        'sphinx_automodapi.smart_resolver',
+        'numpydoc',
+    )]
 
 sphinx_gallery_conf = {
      'examples_dirs': ['../../examples'],   # path to your example scripts
      'gallery_dirs': ['auto_examples'],  # path to where to save gallery generated output
      'matplotlib_animations': True,
+     # e.g. VSM_GALLERY_PATTERN='/plot_spot_growth' to only run one example
+     'filename_pattern': os.environ.get('VSM_GALLERY_PATTERN', r'/plot'),
+     # examples are independent, so run them in separate worker processes.
+     # sphinx-build itself is kept serial (``-j`` does not speed up this project).
+     'parallel': int(os.environ.get('VSM_GALLERY_JOBS', os.cpu_count() or 1)),
     #  'run_stale_examples': True,
+     # cached outputs of a full build are still shown, see ``restore_gallery_cache``
+     'plot_gallery': not FAST,
 }
 
+# Executed examples are cached by the hash of their source, the package version,
+# the python version, and ``VSM_FAST_DOCS`` (which makes some examples skip their
+# slowest plots, see ``plot_star_surface.py``). On a hit, the outputs are restored into the gallery
+# directory before sphinx-gallery runs, so its own md5 check skips the script.
+GALLERY_CACHE = Path(__file__).parent.parent / 'build' / '.gallery_cache'
+
+
+def _example_key(script: Path, fast_docs: str = None) -> str:
+    if fast_docs is None:
+        fast_docs = os.environ.get('VSM_FAST_DOCS', '0')
+    h = hashlib.sha256(script.read_bytes())
+    h.update(vspec_vsm.__version__.encode())
+    h.update(sys.version.encode())
+    h.update(fast_docs.encode())
+    return h.hexdigest()
+
+
+def _example_outputs(gallery_dir: Path, name: str):
+    yield from gallery_dir.glob(f'{name}.*')
+    yield from (gallery_dir / 'images').glob(f'sphx_glr_{name}_*')
+    yield from (gallery_dir / 'images' / 'thumb').glob(f'sphx_glr_{name}_thumb.*')
+
+
+def _galleries(app):
+    conf = app.config.sphinx_gallery_conf
+    srcdir = Path(app.srcdir)
+    for examples_dir, gallery_dir in zip(conf['examples_dirs'], conf['gallery_dirs']):
+        yield (srcdir / examples_dir).resolve(), srcdir / gallery_dir
+
+
+def restore_gallery_cache(app):
+    """
+    Copy cached outputs of unchanged examples into the gallery directory.
+
+    If the examples are not going to be executed, the outputs of a full build are used.
+    """
+    plot_gallery = app.config.sphinx_gallery_conf['plot_gallery']
+    for examples_dir, gallery_dir in _galleries(app):
+        for script in examples_dir.glob('*.py'):
+            cached = GALLERY_CACHE / _example_key(script, None if plot_gallery else '0')
+            if not cached.is_dir():
+                if plot_gallery:
+                    # outputs left in the gallery may come from another
+                    # ``VSM_FAST_DOCS`` setting, so make sphinx-gallery rerun it
+                    (gallery_dir / f'{script.name}.md5').unlink(missing_ok=True)
+                continue
+            for path in cached.rglob('*'):
+                if path.is_file():
+                    dest = gallery_dir / path.relative_to(cached)
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(path, dest)
+
+
+def store_gallery_cache(app, exception):
+    """
+    Save the outputs of freshly executed examples to the cache.
+    """
+    if exception is not None or not app.config.sphinx_gallery_conf['plot_gallery']:
+        return
+    for examples_dir, gallery_dir in _galleries(app):
+        for script in examples_dir.glob('*.py'):
+            cached = GALLERY_CACHE / _example_key(script)
+            md5_file = gallery_dir / f'{script.name}.md5'
+            if cached.is_dir() or not md5_file.is_file():
+                continue
+            # only cache outputs that were produced from the current source
+            if md5_file.read_text().strip() != hashlib.md5(script.read_bytes()).hexdigest():
+                continue
+            tmp = cached.with_suffix('.tmp')
+            shutil.rmtree(tmp, ignore_errors=True)
+            for path in _example_outputs(gallery_dir, script.stem):
+                dest = tmp / path.relative_to(gallery_dir)
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, dest)
+            if tmp.is_dir():
+                tmp.rename(cached)
+
+
+class _AnyOption(dict):
+    def __missing__(self, key):
+        return directives.unchanged
+
+
+class _SkippedAutomodapi(Directive):
+    """
+    Stand-in for ``.. automodapi::`` when sphinx-automodapi is not loaded.
+    """
+    required_arguments = 1
+    option_spec = _AnyOption()
+    has_content = False
+
+    def run(self):
+        text = f'The API reference for {self.arguments[0]} is skipped in fast builds (VSM_FAST_DOCS=1).'
+        return [nodes.note('', nodes.paragraph(text=text))]
+
+
+def setup(app):
+    if FAST:
+        app.add_directive('automodapi', _SkippedAutomodapi)
+    # run before sphinx-gallery's own builder-inited handler (priority 500)
+    app.connect('builder-inited', restore_gallery_cache, priority=400)
+    app.connect('build-finished', store_gallery_cache)
+
 html_theme = 'furo'
 html_static_path = ['_static']
 
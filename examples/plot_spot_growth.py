@@ -51,21 +51,18 @@ print(
 # Step through time
 # -----------------
 #
-# We now will plot the area of the spot as a function of time
+# We now will plot the area of the spot as a function of time.
+#
+# ``StarSpot.area_trace`` evaluates the same growth and decay law
+# as ``SpotCollection.age`` for every time at once, without
+# changing the spot.
 
 dt = 8*u.hr
 total_time = 20*u.day
 n_steps = int(total_time/dt)
 time = np.arange(n_steps)*dt
-area = []
 area_unit = MSH
-for _ in range(n_steps):
-    try:
-        current_area = spotlist.spots[0].area_current.to_value(area_unit)
-    except IndexError:  # the spot has decayed, so `spotlist.spots` is empty
-        current_area = 0
-    area.append(current_area)
-    spotlist.age(dt)
+area = spot.area_trace(time).to_value(area_unit)
 plt.plot(time, area)
 plt.xlabel(f'time ({time.unit})')
 plt.ylabel(f'Spot area {area_unit}')
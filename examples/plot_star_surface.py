@@ -4,6 +4,9 @@ Plot a map of the stellar surface
 
 This example initializes a ``Star`` object and plots it.
 """
+# sphinx_gallery_thumbnail_number = 1
+import os
+
 from astropy import units as u
 import numpy as np
 
@@ -29,28 +32,30 @@ spot_area = 1000*MSH
 facula_radius = 10000*u.km
 facula_depth = 10000*u.km
 
+spot_lats = (rng.random(n_spots) - 0.5)*120*u.deg
+spot_lons = rng.random(n_spots)*360*u.deg
 spots = SpotCollection(
-    *[
-        StarSpot(
-            lat=(rng.random() - 0.5)*120*u.deg,
-            lon=rng.random()*360*u.deg,
-            area_max=spot_area,
-            area_current=spot_area,
-            teff_umbra=2700*u.K,
-            teff_penumbra=2900*u.K,
-            area_over_umbra_area=5.,
-            is_growing=False,
-            growth_rate=0./u.day,
-            decay_rate=0*MSH/u.day
-        ) for _ in range(n_spots)
-    ]
+    *StarSpot.from_arrays(
+        lat=spot_lats,
+        lon=spot_lons,
+        area_max=spot_area,
+        area_current=spot_area,
+        teff_umbra=2700*u.K,
+        teff_penumbra=2900*u.K,
+        area_over_umbra_area=5.,
+        is_growing=False,
+        growth_rate=0./u.day,
+        decay_rate=0*MSH/u.day
+    )
 )
 
+facula_lats = (rng.random(n_faculae) - 0.5)*120*u.deg
+facula_lons = rng.random(n_faculae)*360*u.deg
 faculae = FaculaCollection(
     *[
         Facula(
-            lat=(rng.random() - 0.5)*120*u.deg,
-            lon=rng.random()*360*u.deg,
+            lat=lat,
+            lon=lon,
             r_max=facula_radius,
             r_init=facula_radius,
             depth=facula_radius,
@@ -61,7 +66,7 @@ faculae = FaculaCollection(
             wall_teff_slope=0*u.K/u.km,
             wall_teff_intercept=300*u.K,
             growing=False,
-        ) for _ in range(n_faculae)
+        ) for lat, lon in zip(facula_lats, facula_lons)
     ]
 )
 
@@ -97,10 +102,14 @@ star.plot_surface(lat0, lon0)
 # -------------
 #
 # Let's throw in a transiting planet just for fun.
+#
+# This is the slowest plot in the gallery, so it is skipped
+# when the docs are built with ``VSM_FAST_DOCS=1``.
 
 pl_radius = 1*u.R_earth
 pl_orbit = 0.05*u.AU
 inclination = 89.8*u.deg
 phase = 180.4*u.deg
 
-star.plot_surface(lat0, lon0, None, pl_orbit, pl_radius, phase, inclination)
+if os.environ.get('VSM_FAST_DOCS') != '1':
+    star.plot_surface(lat0, lon0, None, pl_orbit, pl_radius, phase, inclination)
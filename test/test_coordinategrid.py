@@ -6,7 +6,8 @@ import pytest
 import numpy as np
 from astropy import units as u
 
-from vspec_vsm.coordinate_grid import RectangularGrid, SpiralGrid
+from vspec_vsm.coordinate_grid import CoordinateGrid, RectangularGrid, SpiralGrid
+from vspec_vsm.helpers import proj_ortho
 
 def test_rectangulargrid():
     """
@@ -47,6 +48,22 @@ def test_rectangulargrid_grid():
     assert lons.shape == (200, 100)
 
 
+def test_grid_cached():
+    """
+    Tests that the grid, oned, and area arrays are computed once and read-only.
+    """
+    for grid in (RectangularGrid(nlat=100, nlon=200), SpiralGrid(1000)):
+        lats, lons = grid.grid()
+        assert grid.grid()[0] is lats
+        assert grid.grid()[1] is lons
+        assert grid.area is grid.area
+        for arr in (lats, lons, grid.area):
+            with pytest.raises(ValueError):
+                arr[0] = 0
+    grid = RectangularGrid(nlat=100, nlon=200)
+    assert grid.oned()[0] is grid.oned()[0]
+
+
 def test_rectangulargrid_zeros():
     """
     Tests for the CoordinateGrid zeros method.
@@ -58,6 +75,38 @@ def test_rectangulargrid_zeros():
     assert np.all(arr == 0)
 
 
+def test_trig_lat():
+    """
+    Tests for the CoordinateGrid trig_lat method.
+    """
+    for grid in (RectangularGrid(nlat=100, nlon=200), SpiralGrid(1000)):
+        lats, _ = grid.grid()
+        sin_lat, cos_lat = grid.trig_lat()
+        shape = grid.zeros().shape
+        assert np.broadcast_to(sin_lat, shape) == pytest.approx(np.sin(lats).value)
+        assert np.broadcast_to(cos_lat, shape) == pytest.approx(np.cos(lats).value)
+        assert grid.trig_lat()[1] is cos_lat
+
+
+def test_rectangulargrid_scratch():
+    """
+    Tests for the CoordinateGrid scratch method.
+    """
+    grid = RectangularGrid(nlat=100, nlon=200)
+    with grid.scratch() as arr:
+        assert arr.shape == (200, 100)
+        assert arr.dtype == np.float32
+        assert np.all(arr == 0)
+        arr += 1
+        first = arr
+    with grid.scratch() as arr:
+        assert arr is first
+        assert np.all(arr == 0)
+    with grid.scratch(dtype='float64') as arr:
+        assert arr is not first
+        assert arr.dtype == np.float64
+
+
 def test_rectangulargrid_eq():
     """
     Tests for the CoordinateGrid __eq__ method.
@@ -96,6 +145,20 @@ def test_rectangulargrid_display():
     assert dat.unit == u.K
     
 
+def test_rectangulargrid_tiles():
+    """
+    Tests for the RectangularGrid tiles method.
+    """
+    grid = RectangularGrid(nlat=100, nlon=200)
+    lats, lons = grid.grid()
+    covered = grid.zeros(dtype='int16')
+    for index, lat, lon in grid.tiles(tile_lat=64, tile_lon=64):
+        assert np.all(lat == lats[index])
+        assert np.all(lon == lons[index])
+        covered[index] += 1
+    assert np.all(covered == 1)
+
+
 def test_spiralgrid():
     """
     Tests for the SpiralGrid class.
@@ -158,4 +221,103 @@ def test_spiralgrid_display():
     assert llon.shape == (nlon,)
     assert dat.shape == (nlon,nlat)
     assert isinstance(dat, u.Quantity)
-    assert dat.unit == u.K
\ No newline at end of file
+    assert dat.unit == u.K
+    _, indices, weights = grid._display_weights
+    assert indices.dtype == np.int32 and weights.dtype == np.float32
+
+    grid.DISPLAY_CACHE_BYTES = 0
+    _, _, uncached = grid.display_grid(nlat, nlon, data*u.K)
+    assert grid._display_weights is None
+    assert np.all(uncached == dat)
+
+def test_spiralgrid_tiles():
+    """
+    Tests for the SpiralGrid tiles method.
+    """
+    grid = SpiralGrid(n_points=1000)
+    lats, lons = grid.grid()
+    covered = grid.zeros(dtype='int16')
+    for index, lat, lon in grid.tiles(tile_size=300):
+        assert np.all(lat == lats[index])
+        assert np.all(lon == lons[index])
+        covered[index] += 1
+    assert np.all(covered == 1)
+
+
+def test_cos_angle_from_disk_center():
+    """
+    Tests for the CoordinateGrid cos_angle_from_disk_center method.
+    """
+    lat0, lon0 = 30*u.deg, 45*u.deg
+    for grid in (RectangularGrid(nlat=100, nlon=200), SpiralGrid(1000)):
+        lats, lons = grid.grid()
+        expected = (np.sin(lat0)*np.sin(lats)
+                    + np.cos(lat0)*np.cos(lats)*np.cos(lon0-lons)).value
+        mu = grid.cos_angle_from_disk_center(lat0, lon0)
+        assert mu.shape == grid.zeros().shape
+        assert mu.dtype == grid.DTYPE
+        assert mu == pytest.approx(expected, abs=1e-6)
+        with grid.scratch() as buf:
+            assert grid.cos_angle_from_disk_center(lat0, lon0, out=buf) is buf
+            assert buf == pytest.approx(expected, abs=1e-6)
+
+
+def test_area():
+    """
+    Tests for the CoordinateGrid area property.
+    """
+    for grid in (RectangularGrid(nlat=100, nlon=200), SpiralGrid(1000)):
+        area = grid.area
+        assert area.shape == grid.zeros().shape
+        assert np.sum(area) == pytest.approx(1)
+    grid = RectangularGrid(nlat=100, nlon=200)
+    lats, _ = grid.grid()
+    jacobian = np.cos(lats).value
+    assert grid.area.dtype == grid.DTYPE
+    assert grid.area == pytest.approx(jacobian/np.sum(jacobian), rel=1e-5)
+
+
+def test_grid_hash_and_new():
+    """
+    Tests for CoordinateGrid hashing and the reuse of grids by ``new``.
+    """
+    assert hash(RectangularGrid(100, 200)) == hash(RectangularGrid(100, 200))
+    assert hash(SpiralGrid(1000)) == hash(SpiralGrid(1000))
+    assert len({RectangularGrid(100, 200), RectangularGrid(100, 200)}) == 1
+    assert CoordinateGrid.new((100, 200)) is CoordinateGrid.new((100, 200))
+    assert CoordinateGrid.new(1000) is CoordinateGrid.new(1000)
+    assert isinstance(CoordinateGrid.new(1000), SpiralGrid)
+    grid = CoordinateGrid.new(1000)
+    CoordinateGrid.clear_interned()
+    assert CoordinateGrid.new(1000) is not grid
+    with pytest.raises(TypeError):
+        CoordinateGrid.new([100, 200])
+
+
+def test_project_ortho():
+    """
+    Tests for the CoordinateGrid project_ortho method.
+    """
+    lat0, lon0 = 30*u.deg, 45*u.deg
+    for grid in (RectangularGrid(nlat=100, nlon=200), SpiralGrid(1000)):
+        lats, lons = grid.grid()
+        expected_x, expected_y = proj_ortho(lat0, lon0, lats, lons)
+        x, y = grid.project_ortho(lat0, lon0)
+        assert x.shape == grid.zeros().shape
+        assert np.all(np.isnan(x) == np.isnan(expected_x))
+        assert np.all(np.isnan(y) == np.isnan(expected_y))
+        visible = ~np.isnan(expected_x)
+        assert x[visible] == pytest.approx(expected_x[visible])
+        assert y[visible] == pytest.approx(expected_y[visible])
+
+
+def test_grid_views():
+    """
+    Tests for the CoordinateGrid grid_views method.
+    """
+    for grid in (RectangularGrid(nlat=100, nlon=200), SpiralGrid(1000)):
+        lats, lons = grid.grid()
+        lat_view, lon_view = grid.grid_views()
+        shape = grid.zeros().shape
+        assert np.all(np.broadcast_to(lat_view, shape, subok=True) == lats)
+        assert np.all(np.broadcast_to(lon_view, shape, subok=True) == lons)
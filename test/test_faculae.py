@@ -55,6 +55,13 @@ def test_facula_age():
     fac.age(lifetime*0.5)
     assert fac.radius == 100/np.e*u.km
 
+    fac = init_facula(r_max=0.1*u.Mm, r_init=0.05*u.Mm, lifetime=lifetime)
+    fac.age(lifetime*0.1)
+    assert fac.radius.unit == u.Mm
+    collec = FaculaCollection(fac, grid_params=(300, 600))
+    collec.age(lifetime*0.1)
+    assert fac.radius.unit == u.Mm
+
 @pytest.mark.filterwarnings('error')
 def test_facula_effective_area():
     """
@@ -251,6 +258,28 @@ def test_fac_collection_age():
 
 
 
+def test_fac_collection_map_pixels():
+    """
+    Test `FaculaCollection.map_pixels()`
+    """
+    r_star = 0.15*u.R_sun
+    teff = 3000*u.K
+    collec = FaculaCollection(
+        init_facula(lat=0*u.deg, lon=0*u.deg, r_init=0.3*r_star),
+        init_facula(lat=10*u.deg, lon=5*u.deg, r_init=0.3*r_star),
+        init_facula(lat=-40*u.deg, lon=200*u.deg, r_init=0.1*r_star),
+        grid_params=(300, 600)
+    )
+    pixmap = collec.gridmaker.zeros()*u.K + teff
+    with pytest.warns(DeprecationWarning):
+        int_map, map_dict = collec.map_pixels(pixmap, r_star, teff)
+    expected = collec.gridmaker.zeros(dtype='int16')
+    for i, facula in enumerate(collec.faculae):
+        expected[facula.map_pixels(r_star)] = i+1
+    assert np.all(int_map == expected)
+    assert map_dict == {0: 1, 1: 2, 2: 3}
+
+
 def test_fac_gen_init():
     """
     Test for `FaculaGenerator.__init__()`
@@ -13,6 +13,12 @@ def test_round_teff():
     """
     teff = 100.3*u.K
     assert helpers.round_teff(teff) == 100*u.K
+    rounded = helpers.round_teff(teff)
+    rounded += 100*u.K
+    assert helpers.round_teff(teff) == 100*u.K
+    assert helpers.round_teff(100.3*u.deg) == 100*u.deg
+    rounded = helpers.round_teff([100.3, 99.8, 2000.6]*u.K)
+    assert np.all(rounded == [100, 100, 2001]*u.K)
     
 def test_get_angle_between():
     cases = [
@@ -79,6 +85,16 @@ def test_circle_intersection():
     assert helpers.calc_circ_fraction_inside_unit_circle(1, 0, 1) < 0.5
     assert helpers.calc_circ_fraction_inside_unit_circle(0.6, 0, 0.5) > 0.5
 
+    x = np.array([c['args'][0] for c in cases] + [1, 0.6])
+    y = np.array([c['args'][1] for c in cases] + [0, 0])
+    r = np.array([c['args'][2] for c in cases] + [1, 0.5])
+    calc = helpers.calc_circ_fraction_inside_unit_circle(x, y, r)
+    for i, (_x, _y, _r) in enumerate(zip(x, y, r)):
+        assert calc[i] == pytest.approx(
+            helpers.calc_circ_fraction_inside_unit_circle(_x, _y, _r), rel=1e-12)
+    with pytest.raises(ValueError):
+        helpers.calc_circ_fraction_inside_unit_circle(x, y, r + 0.5)
+
 def test_clip_teff():
     """
     Test `VSPEC.helpers.clip_teff`
@@ -1,6 +1,7 @@
 """
 Tests for vspec_vsm.spots.StarSpot
 """
+import warnings
 from astropy import units as u
 import numpy as np
 import pytest
@@ -110,6 +111,12 @@ def test_spot_map_pixels():
     stellar_rad = 1000*u.km
     star_surface_area = 4*np.pi*stellar_rad**2
     spot = init_test_spot(A0=star_surface_area, r_A=1)  # no penumbra
+    radii = spot._radii(stellar_rad)
+    assert spot._radii(stellar_rad) is radii
+    assert radii[0] == pytest.approx(np.pi)
+    spot.area_current = star_surface_area/2
+    assert spot._radii(stellar_rad)[0] == pytest.approx(np.pi/2)
+    spot.area_current = star_surface_area
     pixmaps = spot.map_pixels(stellar_rad)
     umbra = pixmaps[spot.teff_umbra]
     penumbra = pixmaps[spot.teff_penumbra]
@@ -146,6 +153,36 @@ def test_spot_map_pixels():
         ((penumbra & ~umbra)*sin_theta.value).sum(), rel=0.05)
 
 
+def test_spot_r_cached():
+    """
+    Test that StarSpot.r is computed lazily and follows the gridmaker
+    """
+    spot = init_test_spot(grid_params=(30, 60))
+    r = spot.r
+    assert r.shape == spot.gridmaker.zeros().shape
+    assert spot._r is spot._r
+    assert spot._r.dtype == spot.gridmaker.DTYPE
+    spot.set_gridmaker(spot.gridmaker)
+    assert np.all(spot.r == r)
+    collec = SpotCollection(grid_params=(20, 40))
+    collec.add_spot(spot)
+    assert spot.r.shape == collec.gridmaker.zeros().shape
+
+    spots = [init_test_spot(lat=lat*u.deg, lon=2*lat*u.deg, grid_params=(20, 40))
+             for lat in (-30, 0, 60)]
+    chunk_pixels = StarSpot._R_CHUNK_PIXELS
+    StarSpot._R_CHUNK_PIXELS = 2*20*40  # two spots per chunk
+    try:
+        StarSpot.compute_r(spots, spots[0].gridmaker)
+    finally:
+        StarSpot._R_CHUNK_PIXELS = chunk_pixels
+    for spot in spots:
+        batched = spot._r
+        assert batched.base is None  # not a view of the other spots' maps
+        spot._r_grid = None
+        assert spot._r == pytest.approx(batched)
+
+
 def test_spot_surface_fraction():
     """
     Test StarSpot.sufrace_fraction
@@ -159,6 +196,9 @@ def test_spot_surface_fraction():
     sub_obs = {'lat': 0*u.deg, 'lon': 180*u.deg}
     assert spot.surface_fraction(
         sub_obs, stellar_rad) == pytest.approx(0.0, rel=0.01)
+    sub_obs = {'lat': 0*u.deg, 'lon': 90*u.deg}
+    limb = spot.surface_fraction(sub_obs, stellar_rad)
+    assert 0 < limb < 0.02 * 0.1
 
 
 def test_spot_age():
@@ -168,6 +208,8 @@ def test_spot_age():
     spot = init_test_spot(A0=10*MSH, Amax=100*MSH, growth_rate=1 /
                           u.day, decay_rate=10*MSH/u.day, growing=True)
     step = 1*u.day
+    assert spot.growth_rate == 1/u.day
+    assert spot.decay_rate.to_value(MSH/u.day) == pytest.approx(10)
     assert spot.area_current.to_value(MSH) == pytest.approx(10, rel=0.01)
     spot.age(step)
     assert spot.area_current.to_value(MSH) == pytest.approx(20, rel=0.01)
@@ -194,6 +236,61 @@ def test_spot_age():
     assert spot.area_current.to_value(MSH) == pytest.approx(0, rel=0.01)
 
 
+def test_spot_area_trace():
+    """
+    Test StarSpot.area_trace
+    """
+    spot = init_test_spot(A0=10*MSH, Amax=100*MSH, growth_rate=1 /
+                          u.day, decay_rate=10*MSH/u.day, growing=True)
+    step = 8*u.hr
+    time = np.arange(60)*step
+    trace = spot.area_trace(time)
+    assert trace.shape == time.shape
+    assert spot.area_current == 10*MSH, 'area_trace must not age the spot'
+    collec = SpotCollection(spot, grid_params=(30, 60))
+    for expected in trace:
+        if len(collec.spots) == 0:
+            assert expected == 0*MSH
+        else:
+            assert collec.spots[0].area_current.to_value(MSH) == pytest.approx(
+                expected.to_value(MSH), rel=1e-6)
+        collec.age(step)
+    assert trace[-1] == 0*MSH
+
+    # the scalar path of StarSpot.age must follow the same law
+    spot = init_test_spot(A0=10*MSH, Amax=100*MSH, growth_rate=1 /
+                          u.day, decay_rate=10*MSH/u.day, growing=True)
+    for expected in trace[:-1]:
+        if expected > 0*MSH:
+            assert spot.area_current.to_value(MSH) == pytest.approx(
+                expected.to_value(MSH), rel=1e-6)
+        spot.age(step)
+
+
+def test_spot_from_arrays():
+    """
+    Test StarSpot.from_arrays
+    """
+    lats = [0, 10, -20]*u.deg
+    lons = [0, 90, 180]*u.deg
+    spots = StarSpot.from_arrays(
+        lats, lons, 500*MSH, [100, 200, 300]*MSH, 2700*u.K, 2500*u.K,
+        is_growing=[True, False, True], grid_params=(30, 60)
+    )
+    assert len(spots) == 3
+    for spot, lat, lon in zip(spots, lats, lons):
+        assert spot.coords['lat'] == lat
+        assert spot.coords['lon'] == lon
+        assert spot.area_max == 500*MSH
+        assert spot.gridmaker is spots[0].gridmaker
+    assert spots[1].area_current == 200*MSH
+    assert not spots[1].is_growing
+    with pytest.raises(ValueError):
+        StarSpot.from_arrays(
+            [[0]]*u.deg, 0*u.deg, 500*MSH, 100*MSH, 2700*u.K, 2500*u.K
+        )
+
+
 def test_init_spot_collection():
     """
     Test spot initialization
@@ -257,6 +354,21 @@ def test_spot_collection_map_pixels():
     collec = SpotCollection(*spots, grid_params=(300, 600))
     pmap = collec.map_pixels(R_star, Teff)
     assert not np.any(pmap == 2700*u.K)
+    collec._MAP_PIXELS_BLOCK_SIZE = 7*300  # the last block is partial
+    assert np.all(collec.map_pixels(R_star, Teff) == pmap)
+    buffer = collec.gridmaker.acquire()
+    assert np.all(collec.map_pixels(R_star, Teff, out=buffer) == pmap)
+    assert np.all(buffer == pmap.to_value(Teff.unit))
+
+    spot = init_test_spot(Teff_umbra=2500*u.K, Teff_penumbra=2700*u.K, r_A=0.5)
+    collec = SpotCollection(spot, grid_params=(300, 600))
+    pmap = collec.map_pixels(R_star, Teff)
+    umbra = spot.map_pixels(R_star)[spot.teff_umbra]
+    assert np.any(umbra)
+    assert np.all(pmap[umbra] == 2500*u.K)
+    assert np.all(pmap[~umbra] == Teff)
+    area = collec.gridmaker.area
+    assert collec.get_coverage(R_star) == pytest.approx(np.sum(area*umbra)/np.sum(area))
 
     spots = [
         init_test_spot(Teff_umbra=3500*u.K, Teff_penumbra=3500*u.K),
@@ -281,6 +393,15 @@ def test_spot_collection_age():
     collec.age(time*20)
     assert len(collec.spots) == 0
 
+    # a static spot must not warn about inf*0 in the decay term
+    spot = init_test_spot(growing=True)
+    collec = SpotCollection(spot, grid_params=(30, 60))
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        collec.age(time)
+        spot.age(time)
+    assert spot.area_current == 400*MSH
+
 
 def init_spot_generator(**kwargs):
     """
@@ -342,6 +463,14 @@ def test_spot_generator_N_spots_to_birth():
     assert gen.get_n_spots_to_birth(
         time, r_star) == pytest.approx(exp, abs=1e-6)
 
+    gen = init_spot_generator(average_area=100*MSH,
+                              coverage=0.2, decay_rate=10*MSH/u.day, growth_rate=0.5/u.day)
+    for _ in range(2):
+        exp = (gen.coverage * 4*np.pi*r_star**2 / gen.mean_area *
+               time / gen.mean_lifetime).to_value(u.dimensionless_unscaled)
+        assert gen.get_n_spots_to_birth(time, r_star) == pytest.approx(exp)
+        gen.decay_rate *= 2  # in place, the same object
+
 
 def test_spot_generator_get_coordinates():
     """
@@ -87,6 +87,15 @@ def test_get_pixelmap(star:Star):
     assert pixelmap.shape == (star.gridmaker.nlon, star.gridmaker.nlat)
     assert pixelmap.unit == u.K
 
+def test_add_faculae_to_map(star:Star):
+    teffmap = star.add_faculae_to_map(0*u.deg, 0*u.deg)
+    in_facula = np.zeros(teffmap.shape, dtype=bool)
+    for facula in star.faculae.faculae:
+        in_facula |= facula.map_pixels(star.radius)
+    changed = teffmap != star.map
+    assert not np.any(changed & ~in_facula)
+    assert np.any(changed) == np.any(in_facula)
+
 def test_star_with_granulation():
     Teff = 5000 * u.K
     radius = 1 * u.Rsun
@@ -273,7 +282,58 @@ def test_calc_coverage():
     assert dat_tot[f'{star.teff:.2f}'] == 1.0, 'Total coverage must be 1.0'
     # assert dat_cov[star.Teff] == pytest.approx(1/rs_rp**2,rel=1e-3), 'Planet occultation incorrect for phase=90.3deg'
     assert pl_frac == 1, 'All of planet must be visible.'
-    
+
+
+def test_ld_weight_cache():
+    Teff = 3000 * u.K
+    radius = 0.15 * u.R_sun
+    period = 10 * u.day
+    star = Star(Teff, radius, period, SpotCollection(), FaculaCollection(),
+                grid_params=(50, 100), u1=0.1)
+    lat0 = 10*u.deg
+    lon0 = 20*u.deg
+    weight = star.get_ld_weight(lat0, lon0)
+    assert star.get_ld_weight(lat0, lon0) is weight
+    mu = star.get_mu(lat0, lon0)
+    expected = star.ld_mask_for_plotting(mu)*(star.get_jacobian()*star.area_projection_coefficient(mu))
+    assert weight.dtype == np.float32
+    assert mu.dtype == np.float32
+    assert np.all(weight == pytest.approx(expected, rel=1e-6))
+    with pytest.raises(ValueError):
+        weight[0, 0] = 1
+    star.u1 = 0.2
+    assert star.get_ld_weight(lat0, lon0) is not weight
+    star.gridmaker = CoordinateGrid.new((60, 120))
+    assert star.get_mu(lat0, lon0).shape == (120, 60)
+
+def test_transit_masks():
+    Teff = 3000 * u.K
+    radius = 0.15 * u.Rsun
+    period = 10 * u.day
+    spots = SpotCollection()
+    faculae = FaculaCollection()
+    star = Star(Teff, radius, period, spots, faculae,grid_params=(100,200))
+    lat0 = 0*u.deg
+    lon0 = 0*u.deg
+    a = 0.05*u.AU
+    i = 90*u.deg
+    phases = [180, 180.5, 180.8, 90, 0]*u.deg  # 180.8 is on the limb
+    radii = [10, 5, 10, 10, 10]*u.R_earth
+    masks, pl_frac = star.get_transit_masks(lat0, lon0, a, radii, phases, i)
+    assert len(masks) == 5
+    assert masks[3] is masks[4]  # neither is in front of the star
+    assert pl_frac.shape == (5,)
+    for mask, frac, phase, r in zip(masks, pl_frac, phases, radii):
+        assert mask.shape == star.gridmaker.zeros().shape
+        assert mask.dtype == star.DTYPE
+        assert not mask.flags.writeable
+        expected_mask, expected_frac = star.get_transit_mask(lat0, lon0, a, r, phase, i)
+        assert np.all(mask == expected_mask)
+        assert frac == expected_frac
+    with pytest.raises(ValueError):
+        star.get_transit_masks(lat0, lon0, a, radii, [[180]]*u.deg, i)
+
+
 def test_transit_coverage():
     rp_rs = np.logspace(-2.5,-1,10)
     Teff = 3000 * u.K
@@ -15,6 +15,16 @@ equals one millionth of one half the surface area of the Sun.
 :type: astropy.units.Unit
 """
 
+MSH_TO_CM2: float = (1*MSH).to_value(u.cm**2)
+"""
+The size of one micro-solar hemisphere in square centimeters.
+
+Use this to convert spot areas stored as bare floats in MSH without
+going through ``astropy.units``.
+
+:type: float
+"""
+
 stellar_area_unit = MSH
 """
 The standard stellar surface area unit.
@@ -1,11 +1,16 @@
 """
 Coordinate Grid class
 """
-from typing import Tuple, Union
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Tuple, Union
 import warnings
 
 import numpy as np
 from astropy import units as u
+from scipy.spatial import cKDTree
+
+from vspec_vsm.helpers import proj_ortho
 
 
 def get_lat_points(n_points: int) -> u.Quantity:
@@ -48,6 +53,21 @@ class CoordinateGrid:
     """
     Base class for all coordinate grids.
     """
+    POOL_SIZE = 4
+    """
+    The maximum number of scratch buffers kept for reuse by ``acquire()``.
+    """
+    DTYPE = np.float32
+    """
+    The data type of per-point geometry such as ``area`` and
+    ``cos_angle_from_disk_center``.
+    """
+
+    def __init__(self):
+        self._pool: List[np.ndarray] = []
+        self._trig: Tuple[np.ndarray, np.ndarray] = None
+        self._grid_cache: Tuple[u.Quantity, u.Quantity] = None
+        self._area_cache: np.ndarray = None
 
     def _grid(self) -> Tuple[u.Quantity, u.Quantity]:
         raise NotImplementedError(
@@ -71,23 +91,35 @@ class CoordinateGrid:
             An instance of a coordinate grid subclass. If grid_params
             is a tuple, the ``grid`` is a ``RectangularGrid``. If
             ``grid_params`` is an int, the ``grid`` is a ``SpiralGrid``.
+            Recently created grids are reused, so equal ``grid_params``
+            give the same instance and share its cached arrays.
         
         Raises
         ------
         TypeError
             If grid_params is not an int or a tuple.
         """
-        if isinstance(grid_params, int):
-            return SpiralGrid(grid_params)
-        elif isinstance(grid_params, tuple):
-            return RectangularGrid(*grid_params)
-        else:
+        if not isinstance(grid_params, (int, tuple)):
             raise TypeError('grid_params must be of type int or tuple')
+        return _new_grid(grid_params)
+
+    @staticmethod
+    def clear_interned() -> None:
+        """
+        Forget the grids reused by ``new``.
+
+        Later calls to ``new`` build fresh grids. The old grids, along with
+        their cached arrays and scratch buffers, are freed once nothing
+        else refers to them.
+        """
+        _new_grid.cache_clear()
     
     def grid(self) -> Tuple[u.Quantity, u.Quantity]:
         """
         Get a grid of latitudes and longitudes.
 
+        The grid is computed once and shared, so the arrays are read-only.
+
         Returns
         -------
         lat : astropy.units.Quantity
@@ -95,12 +127,54 @@ class CoordinateGrid:
         lon : astropy.units.Quantity
             Array of longitudes.
         """
-        return self._grid()
+        if self._grid_cache is None:
+            lat, lon = self._grid()
+            lat.setflags(write=False)
+            lon.setflags(write=False)
+            self._grid_cache = lat, lon
+        return self._grid_cache
+
+    def grid_views(self) -> Tuple[u.Quantity, u.Quantity]:
+        """
+        Get latitudes and longitudes that broadcast to the shape of ``zeros()``.
+
+        Use this instead of ``grid()`` for elementwise math, so that grids
+        with separable coordinates do not have to be read in full.
+
+        Returns
+        -------
+        lat : astropy.units.Quantity
+            Array of latitudes.
+        lon : astropy.units.Quantity
+            Array of longitudes.
+        """
+        return self.grid()
+
+    def tiles(self, *args, **kwargs) -> Iterator[Tuple[tuple, u.Quantity, u.Quantity]]:
+        """
+        Iterate over the grid in small blocks.
+
+        Work that is applied to many features (e.g. every facula) can be done
+        one block at a time, so the block stays in cache while every feature
+        is tested against it.
+
+        Yields
+        ------
+        index : tuple of slice
+            Index into an array with the shape of ``zeros()``.
+        lat : astropy.units.Quantity
+            Latitudes of the points in the block.
+        lon : astropy.units.Quantity
+            Longitudes of the points in the block.
+        """
+        raise NotImplementedError(
+            'Attempted to call abstract method tiles() from base class')
 
     def cos_angle_from_disk_center(
         self,
         lat0: u.Quantity,
-        lon0: u.Quantity
+        lon0: u.Quantity,
+        out: np.ndarray = None
     ) -> np.ndarray:
         """
         Get the cosine of the angle from disk center.
@@ -111,6 +185,9 @@ class CoordinateGrid:
             The sub-observer latitude.
         lon0 : astropy.units.Quantity
             The sub-observer longitude
+        out : np.ndarray, optional
+            An array with the shape of ``zeros()`` to write the result to,
+            such as a buffer from ``scratch()``. If None, a new array is allocated.
 
         Returns
         -------
@@ -128,11 +205,72 @@ class CoordinateGrid:
 
         Where :math:`x` is the angle from center of the disk.
         """
-        latgrid, longrid = self.grid()
-        mu: u.Quantity = (np.sin(lat0) * np.sin(latgrid)
-                          + np.cos(lat0) * np.cos(latgrid)
-                          * np.cos(lon0-longrid))
-        return mu.to_value(u.dimensionless_unscaled)
+        sin_lat, cos_lat = self.trig_lat()
+        _, longrid = self.grid()
+        lat0 = lat0.to_value(u.rad)
+        mu = np.cos(lon0.to_value(u.rad) - longrid.to_value(u.rad))
+        mu *= np.cos(lat0) * cos_lat
+        mu += np.sin(lat0) * sin_lat
+        if out is None:
+            return mu.astype(self.DTYPE, copy=False)
+        out[...] = mu
+        return out
+
+    def project_ortho(
+        self,
+        lat0: u.Quantity,
+        lon0: u.Quantity
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the orthographic projection of each point.
+
+        Parameters
+        ----------
+        lat0 : astropy.units.Quantity
+            The sub-observer latitude.
+        lon0 : astropy.units.Quantity
+            The sub-observer longitude
+
+        Returns
+        -------
+        x : np.ndarray
+            The x coordinate of each point in the projection.
+        y : np.ndarray
+            The y coordinate of each point in the projection.
+
+        Notes
+        -----
+        This is the same projection as ``vspec_vsm.helpers.proj_ortho``.
+        Points on the far side of the sphere are set to ``nan``.
+        """
+        lat, lon = self.grid()
+        return proj_ortho(lat0, lon0, lat, lon)
+
+    def _trig_lat(self) -> Tuple[np.ndarray, np.ndarray]:
+        lat, _ = self.grid()
+        lat = lat.to_value(u.rad)
+        return np.sin(lat), np.cos(lat)
+
+    def trig_lat(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the sine and cosine of the latitude of each point.
+
+        These only depend on the grid, so they are computed once
+        and shared by everything that maps onto it.
+
+        Returns
+        -------
+        sin_lat : np.ndarray
+            The sine of the latitude, broadcastable to the shape of ``zeros()``.
+        cos_lat : np.ndarray
+            The cosine of the latitude, broadcastable to the shape of ``zeros()``.
+        """
+        if self._trig is None:
+            sin_lat, cos_lat = self._trig_lat()
+            sin_lat.setflags(write=False)
+            cos_lat.setflags(write=False)
+            self._trig = sin_lat, cos_lat
+        return self._trig
 
     @property
     def _area(self):
@@ -144,13 +282,19 @@ class CoordinateGrid:
         """
         Get the area of each point as a fraction of the unit sphere.
 
+        This is computed once and shared, so the array is read-only.
+
         Returns
         -------
         np.ndarray
             The area of each point.
 
         """
-        return self._area
+        if self._area_cache is None:
+            area = self._area
+            area.setflags(write=False)
+            self._area_cache = area
+        return self._area_cache
 
     def _zeros(self, dtype='float32'):
         raise NotImplementedError(
@@ -173,6 +317,69 @@ class CoordinateGrid:
         """
         return self._zeros(dtype=dtype)
 
+    def acquire(self, dtype: str = 'float32') -> np.ndarray:
+        """
+        Get a buffer with the shape of ``zeros()``, reusing a released
+        one if possible.
+
+        Parameters
+        ----------
+        dtype : str, default='float32'
+            Data type of the buffer.
+
+        Returns
+        -------
+        np.ndarray
+            An array with undefined contents.
+        """
+        for i, arr in enumerate(self._pool):
+            if arr.dtype == np.dtype(dtype):
+                return self._pool.pop(i)
+        return self._zeros(dtype=dtype)
+
+    def release(self, arr: np.ndarray) -> None:
+        """
+        Return a buffer from ``acquire()`` to the pool.
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            The buffer to release. It must not be used after this call.
+        """
+        if len(self._pool) < self.POOL_SIZE:
+            self._pool.append(arr)
+
+    @contextmanager
+    def scratch(self, dtype: str = 'float32') -> Iterator[np.ndarray]:
+        """
+        Context manager providing a zeroed, pooled buffer with the shape
+        of ``zeros()``. The buffer is released on exit, so it must not
+        be kept or returned.
+
+        Parameters
+        ----------
+        dtype : str, default='float32'
+            Data type of the buffer.
+
+        Yields
+        ------
+        np.ndarray
+            An array of zeros.
+
+        Examples
+        --------
+        >>> grid = RectangularGrid(100, 200)
+        >>> with grid.scratch() as arr:
+        ...     arr += 1
+        ...     total = arr.sum()
+        """
+        arr = self.acquire(dtype=dtype)
+        arr.fill(0)
+        try:
+            yield arr
+        finally:
+            self.release(arr)
+
     def __eq__(self, other):
         raise NotImplementedError(
             'Attempted to call abstract method __eq__() from base class')
@@ -268,13 +475,22 @@ class RectangularGrid(CoordinateGrid):
             raise TypeError('Nlat must be int')
         if not isinstance(nlon, int):
             raise TypeError('Nlon must be int')
+        super().__init__()
         self.nlat = nlat
         self.nlon = nlon
+        self._oned: Tuple[u.Quantity, u.Quantity] = None
+        # unit-free copies of ``oned()`` for the internal math
+        self._lats_rad = np.linspace(-0.5*np.pi, 0.5*np.pi, nlat)
+        self._lons_rad = np.linspace(0, 2*np.pi, nlon, endpoint=False)
+        self._lats_rad.setflags(write=False)
+        self._lons_rad.setflags(write=False)
 
     def oned(self):
         """
         Create one dimensional arrays of latitude and longitude points.
 
+        The arrays are computed once and shared, so they are read-only.
+
         Returns
         -------
         lats : astropy.units.Quantity , shape=(Nlat,)
@@ -283,9 +499,13 @@ class RectangularGrid(CoordinateGrid):
             Array of longitude points.
 
         """
-        lats = get_lat_points(self.nlat)
-        lons = get_lon_points(self.nlon)
-        return lats, lons
+        if self._oned is None:
+            lats = get_lat_points(self.nlat)
+            lons = get_lon_points(self.nlon)
+            lats.setflags(write=False)
+            lons.setflags(write=False)
+            self._oned = lats, lons
+        return self._oned
 
     def _grid(self):
         """
@@ -302,6 +522,93 @@ class RectangularGrid(CoordinateGrid):
         lats, lons = self.oned()
         return np.meshgrid(lats, lons)
 
+    def grid_views(self):
+        """
+        Latitude only varies along the second axis and longitude along the
+        first, so these have shapes (1, Nlat) and (Nlon, 1).
+        """
+        lats, lons = self.oned()
+        return lats[np.newaxis, :], lons[:, np.newaxis]
+
+    def _trig_lat(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Latitude only varies along the second axis, so
+        the tables have shape (1, Nlat).
+        """
+        lats = self._lats_rad[np.newaxis, :]
+        return np.sin(lats), np.cos(lats)
+
+    def cos_angle_from_disk_center(
+        self,
+        lat0: u.Quantity,
+        lon0: u.Quantity,
+        out: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        The cosine of the angle from disk center is separable into a latitude
+        and a longitude term, so it is built from 1D arrays by broadcasting
+        without using the 2D ``grid()``.
+        """
+        sin_lat, cos_lat = self.trig_lat()
+        lat0 = lat0.to_value(u.rad)
+        cos_dlon = np.cos(lon0.to_value(u.rad) - self._lons_rad)
+        mu = np.empty((self.nlon, self.nlat), dtype=self.DTYPE) if out is None else out
+        np.multiply(cos_dlon[:, np.newaxis], np.cos(lat0) * cos_lat, out=mu)
+        mu += np.sin(lat0) * sin_lat
+        return mu
+
+    def project_ortho(
+        self,
+        lat0: u.Quantity,
+        lon0: u.Quantity
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The projection is built from the 1D latitude and longitude tables
+        by broadcasting, like ``cos_angle_from_disk_center``.
+        """
+        sin_lat, cos_lat = self.trig_lat()
+        lat0 = lat0.to_value(u.rad)
+        sin_lat0, cos_lat0 = np.sin(lat0), np.cos(lat0)
+        dlon = self._lons_rad - lon0.to_value(u.rad)
+        cos_term = np.multiply(np.cos(dlon)[:, np.newaxis], cos_lat)
+        x = np.multiply(np.sin(dlon)[:, np.newaxis], cos_lat)
+        y = cos_term * -sin_lat0
+        y += cos_lat0 * sin_lat
+        # mu, to find the far side of the sphere
+        cos_term *= cos_lat0
+        cos_term += sin_lat0 * sin_lat
+        behind = cos_term < 0
+        x[behind] = np.nan
+        y[behind] = np.nan
+        return x, y
+
+    def tiles(self, tile_lat: int = 64, tile_lon: int = 64):
+        """
+        Iterate over the grid in rectangular blocks.
+
+        Parameters
+        ----------
+        tile_lat : int, default=64
+            The number of latitude points in each block.
+        tile_lon : int, default=64
+            The number of longitude points in each block.
+
+        Yields
+        ------
+        index : tuple of slice
+            ``(lon_slice, lat_slice)``, the index of the block in an array
+            with the shape of ``zeros()``.
+        lat : astropy.units.Quantity , shape=(<=tile_lon, <=tile_lat)
+            Latitudes of the points in the block.
+        lon : astropy.units.Quantity , shape=(<=tile_lon, <=tile_lat)
+            Longitudes of the points in the block.
+        """
+        latgrid, longrid = self.grid()
+        for i in range(0, self.nlon, tile_lon):
+            for j in range(0, self.nlat, tile_lat):
+                index = (slice(i, i+tile_lon), slice(j, j+tile_lat))
+                yield index, latgrid[index], longrid[index]
+
     def _zeros(self, dtype='float32'):
         """
         Get a grid of zeros.
@@ -339,26 +646,34 @@ class RectangularGrid(CoordinateGrid):
             If `other` is not a CoordinateGrid object.
 
         """
+        if other is self:
+            return True
         if not isinstance(other, RectangularGrid):
             raise TypeError('other must be of type RectangularGrid')
         else:
             return (self.nlat == other.nlat) & (self.nlon == other.nlon)
 
+    def __hash__(self):
+        return hash((self.nlat, self.nlon))
+
     @property
     def _area(self) -> np.ndarray:
         """
         Get the area of each point.
 
+        The area only depends on latitude, so a single row of weights
+        is broadcast along the longitude axis instead of being stored
+        for every point.
+
         Returns
         -------
         np.ndarray
             The area of each point.
 
         """
-        latgrid, _ = self.grid()
-        jacobian: u.Quantity = np.sin(latgrid + 90*u.deg)
-        norm: u.Quantity = np.sum(jacobian)
-        return (jacobian/norm).to_value(u.dimensionless_unscaled)
+        jacobian = np.cos(self._lats_rad)
+        jacobian /= np.sum(jacobian)*self.nlon
+        return np.broadcast_to(jacobian.astype(self.DTYPE), (self.nlon, self.nlat))
 
     @property
     def dlat(self):
@@ -401,8 +716,7 @@ class RectangularGrid(CoordinateGrid):
             raise TypeError('data must have shape (nlon, nlat)')
         if not data.shape[1] == nlat:
             raise TypeError('data must have shape (nlon, nlat)')
-        lats, lons = self.oned()
-        return lats.to_value(u.rad), lons.to_value(u.rad), data
+        return self._lats_rad, self._lons_rad, data
 
 
 class SpiralGrid(CoordinateGrid):
@@ -411,9 +725,20 @@ class SpiralGrid(CoordinateGrid):
     using a Fibonacci spiral.
     """
     GOLDEN_RATIO = 0.5*(1+np.sqrt(5))
+    N_NEIGHBORS = 32
+    """
+    The number of nearby grid points used to resample each pixel in ``display_grid``.
+    """
+    DISPLAY_CACHE_BYTES = 2**26
+    """
+    The largest set of ``display_grid`` weights, in bytes, that is kept for reuse.
+    """
 
     def __init__(self, n_points: int):
+        super().__init__()
         self.n_points = n_points
+        self._tree: cKDTree = None
+        self._display_weights: Tuple[Tuple[int, int], np.ndarray, np.ndarray] = None
 
     def _grid(self):
         """
@@ -438,6 +763,30 @@ class SpiralGrid(CoordinateGrid):
         lat = (np.pi/2 - colat)*u.rad
         return lat, lon
 
+    def tiles(self, tile_size: int = 4096):
+        """
+        Iterate over the grid in contiguous blocks of points.
+
+        Parameters
+        ----------
+        tile_size : int, default=4096
+            The number of points in each block.
+
+        Yields
+        ------
+        index : tuple of slice
+            ``(point_slice,)``, the index of the block in an array
+            with the shape of ``zeros()``.
+        lat : astropy.units.Quantity , shape=(<=tile_size,)
+            Latitudes of the points in the block.
+        lon : astropy.units.Quantity , shape=(<=tile_size,)
+            Longitudes of the points in the block.
+        """
+        lat, lon = self.grid()
+        for i in range(0, self.n_points, tile_size):
+            index = (slice(i, i+tile_size),)
+            yield index, lat[index], lon[index]
+
     def _zeros(self, dtype='float32') -> np.ndarray:
         return np.zeros(shape=(self.n_points,), dtype=dtype)
 
@@ -446,9 +795,11 @@ class SpiralGrid(CoordinateGrid):
         """
         The area as a fraction of the unit sphere.
         """
-        return self.zeros() + 1/self.n_points
+        return self.zeros(dtype=self.DTYPE) + 1/self.n_points
 
     def __eq__(self, other) -> bool:
+        if other is self:
+            return True
         if isinstance(other, CoordinateGrid):
             if isinstance(other, SpiralGrid):
                 return self.n_points == other.n_points
@@ -459,6 +810,58 @@ class SpiralGrid(CoordinateGrid):
         else:
             raise TypeError('other must be of type CoordinateGrid')
 
+    def __hash__(self):
+        return hash(self.n_points)
+
+    @staticmethod
+    def _to_cartesian(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """
+        Convert latitude and longitude in radians to points on the unit sphere.
+        """
+        cos_lat = np.cos(lat)
+        return np.stack([cos_lat*np.cos(lon), cos_lat*np.sin(lon), np.sin(lat)], axis=-1)
+
+    def _get_display_weights(self, nlat: int, nlon: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the neighbors and gaussian weights used to resample
+        onto a rectangular grid. They are stored as int32 and float32.
+        Only the most recent output shape is cached, and only if it
+        takes no more than ``DISPLAY_CACHE_BYTES``.
+
+        Returns
+        -------
+        indices : np.ndarray, shape=(nlon, nlat, k)
+            The indices of the nearest grid points to each pixel.
+        weights : np.ndarray, shape=(nlon, nlat, k)
+            The normalized weight of each of those points.
+        """
+        key = (nlat, nlon)
+        if self._display_weights is not None and self._display_weights[0] == key:
+            return self._display_weights[1:]
+        if self._tree is None:
+            lat, lon = self.grid()
+            self._tree = cKDTree(self._to_cartesian(
+                lat.to_value(u.rad), lon.to_value(u.rad)))
+        llat, llon = RectangularGrid(nlat, nlon).grid()
+        xyz = self._to_cartesian(llat.to_value(u.rad), llon.to_value(u.rad))
+        k = min(self.N_NEIGHBORS, self.n_points)
+        chord, indices = self._tree.query(xyz, k=k, workers=-1)
+        if k == 1:
+            chord, indices = chord[..., None], indices[..., None]
+        indices = indices.astype(np.int32)
+        # number density in points per steradian
+        num_density = self.n_points/(4*np.pi)
+        characteristic_len = 1/np.sqrt(num_density)  # characteristic length
+        r = 2*np.arcsin(np.clip(0.5*chord, 0, 1))
+        weights = np.exp(-(r/characteristic_len)**2)
+        weights /= np.sum(weights, axis=-1, keepdims=True)
+        weights = weights.astype(np.float32)
+        if indices.nbytes + weights.nbytes <= self.DISPLAY_CACHE_BYTES:
+            self._display_weights = (key, indices, weights)
+        else:
+            self._display_weights = None
+        return indices, weights
+
     def _display_grid(
         self,
         nlat: int,
@@ -467,27 +870,35 @@ class SpiralGrid(CoordinateGrid):
     ):
         """
         Resample to a rectangular grid using a gaussian.
+
+        Only the ``N_NEIGHBORS`` nearest grid points contribute to each pixel;
+        the gaussian weight of any point farther away is negligible.
         """
         # checks
         if not data.ndim == 1:
             raise ValueError('data must be a 1D array')
         if not data.shape[0] == self.n_points:
             raise ValueError('data must have length n_points')
-        data_lat, data_lon = self.grid()
-        rect = RectangularGrid(nlat, nlon)
+        indices, weights = self._get_display_weights(nlat, nlon)
+        resampled_data = np.sum(weights*data[indices], axis=-1)
+        lats, lons = get_lat_points(nlat), get_lon_points(nlon)
+        return lats.to_value(u.rad), lons.to_value(u.rad), resampled_data
 
-        numerator = np.zeros((nlon, nlat))
-        denominator = np.zeros((nlon, nlat))
-        # number density in points per steradian
-        num_density = self.n_points/(4*np.pi)
-        characteristic_len = 1/np.sqrt(num_density)  # characteristic length
 
-        for value, lat, lon in zip(data, data_lat, data_lon):
-            cos_r = rect.cos_angle_from_disk_center(lat, lon)
-            r = np.arccos(cos_r)
-            weight = np.exp(-(r/characteristic_len)**2)
-            numerator += weight*value
-            denominator += weight
-        resampled_data = numerator/denominator
-        lats, lons = rect.oned()
-        return lats.to_value(u.rad), lons.to_value(u.rad), resampled_data
+@lru_cache(maxsize=8)
+def _new_grid(grid_params: Union[int, Tuple[int, int]]) -> CoordinateGrid:
+    """
+    Create the grid for ``CoordinateGrid.new``, reusing recent ones.
+
+    Interning lets every object built from the same ``grid_params`` share
+    one set of cached arrays and one scratch pool. It also makes the
+    identity checks behind the ``StarSpot`` distance cache hit. The cache is
+    bounded, and so is everything a grid keeps: ``grid()``, ``area`` and
+    ``trig_lat()`` once each, at most ``POOL_SIZE`` scratch buffers, and
+    one set of display weights. Evicting a grid frees all of it once no
+    object uses it anymore.
+    """
+    if isinstance(grid_params, int):
+        return SpiralGrid(grid_params)
+    else:
+        return RectangularGrid(*grid_params)
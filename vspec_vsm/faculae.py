@@ -24,7 +24,10 @@ from astropy import units as u
 from astropy.units.quantity import Quantity
 
 from vspec_vsm.coordinate_grid import CoordinateGrid
-from vspec_vsm.helpers import round_teff, calc_circ_fraction_inside_unit_circle
+from vspec_vsm.helpers import (
+    round_teff, calc_circ_fraction_inside_unit_circle,
+    haversine, age_facula_radius
+)
 from vspec_vsm import config
 
 
@@ -174,11 +177,24 @@ class Facula:
 
         :type: astropy.units.Quantity
         """
-        latgrid, longrid = self.gridmaker.grid()
-        lat0 = self.lat
-        lon0 = self.lon
-        return 2 * np.arcsin(np.sqrt(np.sin(0.5*(lat0-latgrid))**2
-                                    + np.cos(latgrid)*np.cos(lat0)*np.sin(0.5*(lon0 - longrid))**2))
+        return self._r_rad()*u.rad
+
+    def _r_rad(self) -> np.ndarray:
+        """
+        The angular radius to every point on the ``CoordinateGrid`` in radians.
+
+        Returns
+        -------
+        np.ndarray
+            The angular distance of each pixel from the center of the facula.
+        """
+        latgrid, longrid = self.gridmaker.grid_views()
+        _, cos_lat = self.gridmaker.trig_lat()
+        return haversine(
+            self.lat.to_value(u.rad), self.lon.to_value(u.rad),
+            latgrid.to_value(u.rad), longrid.to_value(u.rad),
+            cos_lats=cos_lat
+        )
 
     def set_gridmaker(self, gridmaker: CoordinateGrid):
         """
@@ -214,16 +230,15 @@ class Facula:
         to False if so. If the facula is no longer growing, it shrinks over time.
 
         """
-        if self.is_growing:
-            time_from_max = -1*np.log(self.radius/self.r_max)*self.lifetime*0.5
-            if time_from_max <= time:
-                self.is_growing = False
-                time = time - time_from_max
-                self.radius = self.r_max * np.exp(-2*time/self.lifetime)
-            else:
-                self.radius = self.radius * np.exp(2*time/self.lifetime)
-        else:
-            self.radius = self.radius * np.exp(-2*time/self.lifetime)
+        radius, is_growing = age_facula_radius(
+            self.radius.to_value(u.km),
+            self.r_max.to_value(u.km),
+            self.is_growing,
+            (time/self.lifetime).to_value(u.dimensionless_unscaled)
+        )
+        # the kernel works in km, but keep the unit the radius was given in
+        self.radius = (float(radius)*u.km).to(self.radius.unit)
+        self.is_growing = bool(is_growing)
 
     def effective_area(self, angle):
         """
@@ -317,8 +332,8 @@ class Facula:
         numpy.ndarray
             Boolean array indicating whether each pixel is within the facula radius.
         """
-        rad = self.angular_radius(star_rad)
-        pix_in_fac = self._r <= rad
+        rad = self.angular_radius(star_rad).to_value(u.rad)
+        pix_in_fac = self._r_rad() <= rad
         return pix_in_fac
 
 
@@ -407,9 +422,24 @@ class FaculaCollection:
         time : astropy.units.Quantity 
             Length of time to age the spot.
             For most realistic behavior, time should be << spot lifetime.
-        """
-        for facula in self.faculae:
-            facula.age(time)
+
+        Notes
+        -----
+        This applies the same growth and decay law as ``Facula.age``, but
+        to every facula at once. The state of each facula is gathered into arrays,
+        updated, and written back.
+        """
+        if len(self.faculae) > 0:
+            radius = np.array([facula.radius.to_value(u.km) for facula in self.faculae])
+            r_max = np.array([facula.r_max.to_value(u.km) for facula in self.faculae])
+            # time in units of each facula's lifetime
+            t = np.array([(time/facula.lifetime).to_value(u.dimensionless_unscaled)
+                          for facula in self.faculae])
+            is_growing = np.array([facula.is_growing for facula in self.faculae], dtype=bool)
+            radius, is_growing = age_facula_radius(radius, r_max, is_growing, t)
+            for facula, rad, growing in zip(self.faculae, radius.tolist(), is_growing.tolist()):
+                facula.radius = (rad*u.km).to(facula.radius.unit)
+                facula.is_growing = growing
         self.clean_faclist()
 
     def map_pixels(self, pixmap, star_rad, star_teff):
@@ -438,12 +468,25 @@ class FaculaCollection:
         warnings.warn(
             'Use `Star.add_faculae_to_map` method instead.', DeprecationWarning)
         int_map = self.gridmaker.zeros(dtype='int16')
-        map_dict = {}
-        for i, facula in enumerate(self.faculae):
-            pix_in_fac = facula.map_pixels(star_rad)
-            is_photosphere = pixmap == star_teff
-            int_map[pix_in_fac & is_photosphere] = i+1
-            map_dict[i] = i+1
+        is_photosphere = pixmap == star_teff
+        centers = [(facula.lat.to_value(u.rad), facula.lon.to_value(u.rad))
+                   for facula in self.faculae]
+        radii = [facula.angular_radius(star_rad).to_value(u.rad)
+                 for facula in self.faculae]
+        _, cos_lat = self.gridmaker.trig_lat()
+        cos_lat = np.broadcast_to(cos_lat, int_map.shape)
+        # Loop over blocks of the grid first so each block is tested against
+        # every facula while it is still in cache.
+        for index, latgrid, longrid in self.gridmaker.tiles():
+            lats = latgrid.to_value(u.rad)
+            lons = longrid.to_value(u.rad)
+            int_tile = int_map[index]
+            phot_tile = is_photosphere[index]
+            cos_tile = cos_lat[index]
+            for i, ((lat0, lon0), rad) in enumerate(zip(centers, radii)):
+                pix_in_fac = haversine(lat0, lon0, lats, lons, cos_lats=cos_tile) <= rad
+                int_tile[pix_in_fac & phot_tile] = i+1
+        map_dict = {i: i+1 for i in range(len(self.faculae))}
         return int_map, map_dict
 
 
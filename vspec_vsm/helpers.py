@@ -17,7 +17,7 @@ def round_teff(teff):
     Parameters
     ----------
     teff : astropy.units.Quantity
-        The temperature to round.
+        The temperature to round. It can be a scalar or an array.
 
     Returns
     -------
@@ -40,11 +40,14 @@ def round_teff(teff):
     >>> print(rounded_teff)
     2000 K
 
-    """
+    >>> teff = [1234.56, 2000.4] * u.K
+    >>> print(round_teff(teff))
+    [1235. 2000.] K
 
-    val = teff.value
-    unit = teff.unit
-    return int(round(val)) * unit
+    """
+    if np.ndim(teff) > 0:
+        return np.rint(teff.value) * teff.unit
+    return int(round(teff.value)) * teff.unit
 
 def get_angle_between(
     lat1: u.Quantity,
@@ -97,10 +100,143 @@ def get_angle_between(
     0.27581902582503454 rad
 
     """
+    lat1: np.ndarray = u.Quantity(lat1).to_value(u.rad)
+    lon1: np.ndarray = u.Quantity(lon1).to_value(u.rad)
+    lat2: np.ndarray = u.Quantity(lat2).to_value(u.rad)
+    lon2: np.ndarray = u.Quantity(lon2).to_value(u.rad)
     mu = (np.sin(lat1) * np.sin(lat2)
           + np.cos(lat1) * np.cos(lat2)
           * np.cos(lon1-lon2))
-    return np.arccos(mu)
+    return np.arccos(np.clip(mu, -1, 1))*u.rad
+
+def haversine(
+    lat0: float,
+    lon0: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    cos_lats: np.ndarray = None
+) -> np.ndarray:
+    """
+    Compute the angular distance from one point to many others
+    using the haversine formula.
+
+    Unlike ``get_angle_between``, this works on bare floats so that it
+    can be used on full surface grids without the overhead of
+    `astropy.units.Quantity` arithmetic.
+
+    Parameters
+    ----------
+    lat0 : float
+        The latitude of the central point in radians.
+    lon0 : float
+        The longitude of the central point in radians.
+    lats : np.ndarray
+        The latitude of the other points in radians.
+    lons : np.ndarray
+        The longitude of the other points in radians.
+    cos_lats : np.ndarray, optional
+        The cosine of `lats`, if it is already known (e.g. from
+        ``CoordinateGrid.trig_lat``). It must broadcast against `lats`.
+
+    Returns
+    -------
+    np.ndarray
+        The angular distance of each point from the central point in radians.
+    """
+    if cos_lats is None:
+        cos_lats = np.cos(lats)
+    # not in-place, since either term may have fewer dimensions than the result
+    a = np.add(np.sin(0.5*(lat0-lats))**2,
+               cos_lats*np.cos(lat0)*np.sin(0.5*(lon0-lons))**2)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2
+    return a
+
+def age_spot_area(
+    area_current: np.ndarray,
+    area_max: np.ndarray,
+    growth_rate: np.ndarray,
+    decay_rate: np.ndarray,
+    is_growing: np.ndarray,
+    time: float
+):
+    """
+    Apply the growth and decay law of ``StarSpot.age`` to bare floats.
+
+    Parameters
+    ----------
+    area_current : np.ndarray
+        The current area of each spot in MSH.
+    area_max : np.ndarray
+        The maximum area of each spot in MSH.
+    growth_rate : np.ndarray
+        The fractional growth rate of each spot per day.
+    decay_rate : np.ndarray
+        The decay rate of each spot in MSH per day.
+    is_growing : np.ndarray
+        Whether each spot is growing.
+    time : float
+        The time to age the spots in days.
+
+    Returns
+    -------
+    area : np.ndarray
+        The new area of each spot in MSH.
+    is_growing : np.ndarray
+        Whether each spot is still growing.
+    """
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        tau = np.log(growth_rate + 1)
+        time_to_max = np.where(
+            tau == 0, np.inf, np.log(area_max/area_current)/tau)
+        keeps_growing = is_growing & (time_to_max > time)
+        growth = area_current*np.exp(tau*time)
+        area_decay = np.where(is_growing, time - time_to_max, time)*decay_rate
+    decay = np.where(
+        area_decay > area_max,
+        0,
+        np.where(is_growing, area_max, area_current) - area_decay
+    )
+    return np.where(keeps_growing, growth, decay), keeps_growing
+
+
+def age_facula_radius(
+    radius: np.ndarray,
+    r_max: np.ndarray,
+    is_growing: np.ndarray,
+    time: np.ndarray
+):
+    """
+    Apply the growth and decay law of ``Facula.age`` to bare floats.
+
+    Parameters
+    ----------
+    radius : np.ndarray
+        The current radius of each facula.
+    r_max : np.ndarray
+        The maximum radius of each facula, in the same unit as `radius`.
+    is_growing : np.ndarray
+        Whether each facula is growing.
+    time : np.ndarray
+        The time to age each facula in units of its lifetime.
+
+    Returns
+    -------
+    radius : np.ndarray
+        The new radius of each facula.
+    is_growing : np.ndarray
+        Whether each facula is still growing.
+    """
+    time_from_max = -1*np.log(radius/r_max)*0.5
+    reaches_max = is_growing & (time_from_max <= time)
+    radius = np.where(
+        reaches_max,
+        r_max*np.exp(-2*(time - time_from_max)),
+        radius*np.exp(np.where(is_growing, 2*time, -2*time))
+    )
+    return radius, is_growing & ~reaches_max
+
 
 def proj_ortho(
     lat0: u.Quantity,
@@ -109,8 +245,8 @@ def proj_ortho(
     lons: u.Quantity
 ):
     """
-    Use the spherical law of cosines to project each
-    lat/lon point onto the x-y plane.
+    Project each lat/lon point onto the x-y plane
+    using an orthographic projection.
 
     Parameters
     ----------
@@ -134,21 +270,16 @@ def proj_ortho(
 
     Notes
     -----
-    This function uses the spherical law of cosines to project each lat/lon point
-    onto the x-y plane of an orthographic projection.
-
-    Spherical law of cosines:
+    This function uses the standard orthographic projection centered on
+    :math:`(\\phi_0, \\lambda_0)`:
 
     .. math::
 
-        \\cos{c} = \\cos{a} \\cos{b} + \\sin{a} \\sin{b} \\cos{C}
+        x = \\cos{\\phi} \\sin{(\\lambda - \\lambda_0)}
 
-    We want to find :math:`C`.
-        - :math:`b` is the colatitude of the central point.
-        - :math:`c` is the colatitude of the other points.
-        - :math:`a` is the distance of each point from the center (i.e. :math:`\\cos{\\mu}`)
-    This can be difficult for special cases, but this code attempts
-    to account for those.
+        y = \\cos{\\phi_0} \\sin{\\phi} - \\sin{\\phi_0} \\cos{\\phi} \\cos{(\\lambda - \\lambda_0)}
+
+    Points on the far side of the sphere (:math:`\\mu < 0`) are set to ``nan``.
 
     Examples
     --------
@@ -176,47 +307,14 @@ def proj_ortho(
     lat0: float = lat0.to_value(u.rad)
     lons: np.ndarray = lons.to_value(u.rad)
     lats: np.ndarray = lats.to_value(u.rad)
-    b = np.pi/2 - lat0
-    c = np.pi/2 - lats
-    if b == 0:  # centered on north pole
-        a = c
-        C = np.where(c <= np.pi/2, np.pi-lons, np.nan)
-    elif b == np.pi:  # centered on south pole
-        a = c
-        C = np.where(c >= np.pi/2, lons, np.nan)
-    else:  # centered elsewhere
-        mu = (np.sin(lat0) * np.sin(lats)
-              + np.cos(lat0) * np.cos(lats)
-              * np.cos(lon0-lons))
-        a = np.arccos(mu)
-        num = np.cos(c) - np.cos(a)*np.cos(b)
-        den = np.sin(a)*np.sin(b)
-        den[den==0]=1e-20 # supress warning. This is overwritten anyway.
-        cos_C = np.where(
-            mu < 1,
-            num / den,
-            1
-        )
-        cos_C = np.round(cos_C, 4)
-        C = np.where(
-            lons == lon0,
-            0, np.arccos(cos_C)
-        )
-        C = np.where(
-            (lons == lon0) & (lats < lat0),
-            np.pi, C
-        )
-        C = np.where(
-            mu >= 0,
-            C,
-            np.nan
-        )
-        C = np.where(
-            np.sin(lons-lon0) < 0,
-            -C, C
-        )
-    x = np.sin(C)*np.sin(a)
-    y = np.cos(C)*np.sin(a)
+    sin_lat0, cos_lat0 = np.sin(lat0), np.cos(lat0)
+    cos_lats = np.cos(lats)
+    dlon = lons - lon0
+    cos_dlon = np.cos(dlon)
+    mu = sin_lat0*np.sin(lats) + cos_lat0*cos_lats*cos_dlon
+    behind = mu < 0
+    x = np.where(behind, np.nan, cos_lats*np.sin(dlon))
+    y = np.where(behind, np.nan, cos_lat0*np.sin(lats) - sin_lat0*cos_lats*cos_dlon)
     return x, y
 
 
@@ -229,17 +327,18 @@ def calc_circ_fraction_inside_unit_circle(x, y, r):
 
     Parameters
     ----------
-    x : float
+    x : float or np.ndarray
         The x coordinate of the circle's center.
-    y : float
+    y : float or np.ndarray
         The y coordinate of the circle's center.
-    r : float
+    r : float or np.ndarray
         The circle's radius.
 
     Returns
     -------
-    float
+    float or np.ndarray
         The fraction of the circle that lies inside the unit circle.
+        An array is returned if any of the inputs is an array.
 
     Raises
     ------
@@ -256,30 +355,30 @@ def calc_circ_fraction_inside_unit_circle(x, y, r):
     [1].  Weisstein, Eric W. "Circle-Circle Intersection."
         From MathWorld--A Wolfram Web Resource. https://mathworld.wolfram.com/Circle-CircleIntersection.html 
     """
-    x0, y0, r0 = 0, 0, 1
-    d = np.sqrt((x-x0)**2 + (y-y0)**2)
-    if r > 1:
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    r = np.asarray(r, dtype=float)
+    if np.any(r > 1):
         raise ValueError('R must be less than 1.')
-
-    if d > (r0 + r):
-        return 0.0
-    if d <= (r0 - r):
-        return 1.0
-    if d == 0 and r == 1:  # it is the unit circle
-        return 1.0
-
-    R = r0
-    d1 = (d**2 - r**2 + R**2) / (2*d)
-    d2 = (d**2 + r**2 - R**2) / (2*d)
-
-    def area(_R, _d):
-        return _R**2 * np.arccos(_d/_R) - _d * np.sqrt(_R**2 - _d**2)
-    A1 = area(R, d1)
-    A2 = area(r, d2)
-    area_of_intersection = A1+A2
-
-    area_of_circle = np.pi*r**2
-    return area_of_intersection/area_of_circle
+    d = np.hypot(x, y)
+    R = 1
+    # Evaluate the general case everywhere and then overwrite the trivial
+    # cases. The clipping keeps arccos/sqrt defined where the general
+    # formula does not apply (e.g. d == 0).
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = (d**2 - r**2 + R**2) / (2*d)
+        d2 = (d**2 + r**2 - R**2) / (2*d)
+        A1 = R**2 * np.arccos(np.clip(d1/R, -1, 1)) \
+            - d1 * np.sqrt(np.maximum(R**2 - d1**2, 0))
+        A2 = r**2 * np.arccos(np.clip(d2/r, -1, 1)) \
+            - d2 * np.sqrt(np.maximum(r**2 - d2**2, 0))
+        area_of_intersection = A1+A2
+        area_of_circle = np.pi*r**2
+        frac = area_of_intersection/area_of_circle
+    frac = np.where(d > (R + r), 0.0, np.where(d <= (R - r), 1.0, frac))
+    if frac.ndim == 0:
+        return float(frac)
+    return frac
 
 def clip_teff(teff: u.Quantity):
     """
@@ -8,13 +8,18 @@ the behavior of spots.
 """
 from typing import List, Union, Tuple
 import typing as Typing
+import math
 
 import numpy as np
 from astropy import units as u
 from astropy.units.quantity import Quantity
+from scipy.special import j1
 
 from vspec_vsm.coordinate_grid import CoordinateGrid
-from vspec_vsm.config import MSH
+from vspec_vsm.config import MSH, MSH_TO_CM2
+from vspec_vsm.helpers import age_spot_area, haversine
+
+_GAUSS_LEGENDRE_NODES, _GAUSS_LEGENDRE_WEIGHTS = np.polynomial.legendre.leggauss(32)
 
 
 class StarSpot:
@@ -101,6 +106,11 @@ class StarSpot:
     :cite:t:`2015ApJ...806..212D`
     """
 
+    _R_CHUNK_PIXELS = 2**22
+    """
+    The number of pixels ``compute_r`` evaluates in one call to ``haversine``.
+    """
+
     def __init__(
         self,
         lat: Quantity,
@@ -126,6 +136,10 @@ class StarSpot:
         self.total_area_over_umbra_area = area_over_umbra_area
         self.is_growing = is_growing
         self.growth_rate = growth_rate
+        self._r_grid: CoordinateGrid = None
+        self._r_cache: np.ndarray = None
+        self._radii_key: tuple = None
+        self._radii_cache: Tuple[float, float] = None
 
         if gridmaker is None:
             self.set_gridmaker(CoordinateGrid.new(grid_params))
@@ -142,11 +156,184 @@ class StarSpot:
             The `CoordinateGrid` object to set
         """
         self.gridmaker = gridmaker
-        latgrid, longrid = self.gridmaker.grid()
-        lat0 = self.coords['lat']
-        lon0 = self.coords['lon']
-        self.r = 2 * np.arcsin(np.sqrt(np.sin(0.5*(lat0-latgrid))**2
-                                       + np.cos(latgrid)*np.cos(lat0)*np.sin(0.5*(lon0 - longrid))**2))
+
+    @property
+    def _r(self) -> np.ndarray:
+        """
+        The angular distance of every point on the ``CoordinateGrid`` from
+        the center of the spot in radians.
+
+        It is computed when first needed and again only if ``gridmaker`` is
+        replaced, so it is read-only. It is stored as ``CoordinateGrid.DTYPE``
+        since it is only ever compared against the spot radius.
+
+        :type: np.ndarray
+        """
+        if self._r_grid is not self.gridmaker:
+            self.compute_r([self], self.gridmaker)
+        return self._r_cache
+
+    @staticmethod
+    def compute_r(spots: List['StarSpot'], gridmaker: CoordinateGrid) -> None:
+        """
+        Compute the distance maps of many spots on the same grid at once.
+
+        The distances of every spot whose map is not already cached for
+        `gridmaker` are found with one call to ``haversine`` per chunk of
+        about ``_R_CHUNK_PIXELS`` pixels. Each spot keeps its own copy,
+        so a spot does not keep the maps of the others alive.
+
+        Parameters
+        ----------
+        spots : list of StarSpot
+            The spots. Each must already use `gridmaker`.
+        gridmaker : CoordinateGrid
+            The grid shared by the spots.
+        """
+        spots = [spot for spot in spots if spot._r_grid is not gridmaker]
+        if len(spots) == 0:
+            return
+        latgrid, longrid = gridmaker.grid_views()
+        latgrid, longrid = latgrid.to_value(u.rad), longrid.to_value(u.rad)
+        _, cos_lat = gridmaker.trig_lat()
+        n_pixels = int(np.prod(np.broadcast_shapes(latgrid.shape, longrid.shape)))
+        chunk_size = max(1, StarSpot._R_CHUNK_PIXELS // n_pixels)
+        for start in range(0, len(spots), chunk_size):
+            chunk = spots[start:start+chunk_size]
+            # one leading axis for the spots, broadcast against the grid
+            shape = (len(chunk),) + (1,)*latgrid.ndim
+            lat0 = np.array([spot.coords['lat'].to_value(u.rad) for spot in chunk]).reshape(shape)
+            lon0 = np.array([spot.coords['lon'].to_value(u.rad) for spot in chunk]).reshape(shape)
+            r = haversine(lat0, lon0, latgrid, longrid, cos_lats=cos_lat)
+            for spot, spot_r in zip(chunk, r):
+                spot_r = spot_r.astype(gridmaker.DTYPE)
+                spot_r.setflags(write=False)
+                spot._r_cache = spot_r
+                spot._r_grid = gridmaker
+
+    @property
+    def r(self) -> Quantity:
+        """
+        The angular distance of every point on the ``CoordinateGrid`` from
+        the center of the spot.
+
+        :type: astropy.units.Quantity
+        """
+        return u.Quantity(self._r, u.rad, copy=False)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        lat: Quantity,
+        lon: Quantity,
+        area_max: Quantity,
+        area_current: Quantity,
+        teff_umbra: Quantity,
+        teff_penumbra: Quantity,
+        area_over_umbra_area: Union[float, np.ndarray] = 5,
+        is_growing: Union[bool, np.ndarray] = True,
+        growth_rate: Quantity = 0.52/u.day,
+        decay_rate: Quantity = 10.89 * MSH/u.day,
+        grid_params: Union[int, Tuple[int, int]] = (500, 1000),
+        gridmaker: CoordinateGrid = None
+    ) -> Tuple['StarSpot']:
+        """
+        Create many spots at once from arrays of parameters.
+
+        Parameters
+        ----------
+        lat, lon, area_max, area_current, teff_umbra, teff_penumbra, area_over_umbra_area,
+        is_growing, growth_rate, decay_rate : array-like
+            The parameters of each spot, as in ``StarSpot``. Scalars are
+            shared by every spot, and arrays must all have the same length.
+        grid_params : int or tuple, default=(500, 1000)
+            The parameters of the grid, if `gridmaker` is not given.
+        gridmaker : CoordinateGrid, default=None
+            The grid shared by all of the new spots. If None, one is created
+            from `grid_params`.
+
+        Returns
+        -------
+        tuple of StarSpot
+            The new spots.
+        """
+        params = np.broadcast_arrays(
+            lat, lon, area_max, area_current, teff_umbra, teff_penumbra,
+            area_over_umbra_area, is_growing, growth_rate, decay_rate,
+            subok=True
+        )
+        if params[0].ndim != 1:
+            raise ValueError('Spot parameters must be scalars or 1D arrays.')
+        if gridmaker is None:
+            gridmaker = CoordinateGrid.new(grid_params)
+        return tuple(
+            cls(
+                _lat, _lon, _area_max, _area_current, _teff_umbra, _teff_penumbra,
+                area_over_umbra_area=_ratio,
+                is_growing=bool(_growing),
+                growth_rate=_growth_rate,
+                decay_rate=_decay_rate,
+                gridmaker=gridmaker
+            ) for (
+                _lat, _lon, _area_max, _area_current, _teff_umbra, _teff_penumbra,
+                _ratio, _growing, _growth_rate, _decay_rate
+            ) in zip(*params)
+        )
+
+    @property
+    def area_current(self) -> Quantity:
+        """
+        The current area of the spot.
+
+        It is stored as a float in MSH so that aging does not
+        need `astropy.units.Quantity` arithmetic.
+
+        :type: astropy.units.Quantity
+        """
+        return self._area_current*MSH
+
+    @area_current.setter
+    def area_current(self, value: Quantity):
+        self._area_current = float(value.to_value(MSH))
+
+    @property
+    def area_max(self) -> Quantity:
+        """
+        The maximum area a spot reaches before it decays.
+
+        :type: astropy.units.Quantity
+        """
+        return self._area_max*MSH
+
+    @area_max.setter
+    def area_max(self, value: Quantity):
+        self._area_max = float(value.to_value(MSH))
+
+    @property
+    def growth_rate(self) -> Quantity:
+        """
+        Fractional growth of the spot for a given unit time.
+
+        :type: astropy.units.Quantity
+        """
+        return self._growth_rate/u.day
+
+    @growth_rate.setter
+    def growth_rate(self, value: Quantity):
+        self._growth_rate = float(value.to_value(1/u.day))
+
+    @property
+    def decay_rate(self) -> Quantity:
+        """
+        The rate at which a spot linearly decays.
+
+        :type: astropy.units.Quantity
+        """
+        return self._decay_rate*MSH/u.day
+
+    @decay_rate.setter
+    def decay_rate(self, value: Quantity):
+        self._decay_rate = float(value.to_value(MSH/u.day))
 
     def __str__(self):
         s = 'StarSpot with '
@@ -167,7 +354,7 @@ class StarSpot:
         astropy.units.Quantity
             The radius of the spot.
         """
-        return np.sqrt(self.area_current/np.pi).to(u.km)
+        return (np.sqrt(self._area_current*MSH_TO_CM2/np.pi)*u.cm).to(u.km)
 
     def angular_radius(self, star_rad: Quantity) -> Quantity:
         """
@@ -185,8 +372,35 @@ class StarSpot:
         astropy.units.Quantity 
             The angular radius of the spot.
         """
-        cos_angle = 1 - self.area_current/(2*np.pi*star_rad**2)
-        return (np.arccos(cos_angle)).to(u.deg)
+        cos_angle = 1 - self._area_current*MSH_TO_CM2/(2*np.pi*star_rad.to_value(u.cm)**2)
+        # a spot covering the whole star can round to just below -1
+        return np.rad2deg(np.arccos(max(cos_angle, -1.0)))*u.deg
+
+    def _radii(self, star_rad: Quantity) -> Tuple[float, float]:
+        """
+        Get the angular radius of the whole spot and of its umbra.
+
+        The result is cached until the area of the spot, the
+        umbra ratio, or `star_rad` changes.
+
+        Parameters
+        ----------
+        star_rad : astropy.units.Quantity
+            The radius of the star.
+
+        Returns
+        -------
+        radius : float
+            The angular radius of the spot in radians.
+        radius_umbra : float
+            The angular radius of the umbra in radians.
+        """
+        key = (self._area_current, self.total_area_over_umbra_area, star_rad.to_value(u.cm))
+        if self._radii_key != key:
+            radius = float(self.angular_radius(star_rad).to_value(u.rad))
+            self._radii_cache = (radius, radius/np.sqrt(self.total_area_over_umbra_area))
+            self._radii_key = key
+        return self._radii_cache
 
     def map_pixels(self, star_rad: Quantity) -> dict:
         """
@@ -211,10 +425,9 @@ class StarSpot:
         keys, `Teff_umbra` and `Teff_penumbra`, whose values are boolean arrays
         indicating which points are covered by each region.
         """
-        radius = self.angular_radius(star_rad)
-        radius_umbra = radius/np.sqrt(self.total_area_over_umbra_area)
-        return {self.teff_umbra: self.r < radius_umbra,
-                self.teff_penumbra: self.r < radius}
+        radius, radius_umbra = self._radii(star_rad)
+        return {self.teff_umbra: self._r < radius_umbra,
+                self.teff_penumbra: self._r < radius}
 
     def surface_fraction(self, sub_obs_coords: dict,
                          star_rad: Quantity, n_points: int = 1001) -> float:
@@ -231,26 +444,46 @@ class StarSpot:
             lon are astropy.units.Quantity objects.
         star_rad : astropy.units.Quantity 
             Radius of the star.
-        N : int, optional
-            Number of points to use in numerical integration.
-            N=1000 is not so different from N=100000.
+        n_points : int, optional
+            Unused. Kept for compatibility with the previous numerical integration.
 
         Returns
         -------
         float
             Fraction of observed disk covered by the spot.
 
+        Notes
+        -----
+        The spot is a disk of angular radius :math:`a` whose center is :math:`c_0`
+        from disk center. Each strip at distance :math:`c` is weighted by :math:`\\cos{c}`:
+
+        .. math::
+
+            f = \\frac{1}{2\\pi} \\int_{-\\pi/2}^{\\pi/2} 2 \\cos{c} \\sqrt{a^2 - (c-c_0)^2} dc
+
+        If the spot does not reach the limb this is :math:`a J_1(a) \\cos{c_0}`.
+        Otherwise the integral is evaluated with Gauss-Legendre quadrature after
+        substituting :math:`c - c_0 = a \\sin{\\theta}`, which makes the integrand smooth.
         """
-        cos_c0 = (np.sin(sub_obs_coords['lat']) * np.sin(self.coords['lat'])
-                  + np.cos(sub_obs_coords['lat']) * np.cos(self.coords['lat'])
-                  * np.cos(sub_obs_coords['lon']-self.coords['lon']))
-        c0 = np.arccos(cos_c0)
-        c = np.linspace(-90, 90, n_points)*u.deg
-        a = self.angular_radius(star_rad).to(u.deg)
-        rad = a**2 - (c-c0)**2
-        rad[rad < 0] = 0
-        integrand = 2 * np.cos(c)*np.sqrt(rad)
-        return (np.trapz(integrand, x=c)/(2*np.pi*u.steradian)).to_value(u.dimensionless_unscaled)
+        lat0 = sub_obs_coords['lat'].to_value(u.rad)
+        lon0 = sub_obs_coords['lon'].to_value(u.rad)
+        lat = self.coords['lat'].to_value(u.rad)
+        lon = self.coords['lon'].to_value(u.rad)
+        cos_c0 = (np.sin(lat0) * np.sin(lat)
+                  + np.cos(lat0) * np.cos(lat) * np.cos(lon0 - lon))
+        c0 = np.arccos(np.clip(cos_c0, -1, 1))
+        a = self.angular_radius(star_rad).to_value(u.rad)
+        t_low = max(-a, -0.5*np.pi - c0)
+        t_high = min(a, 0.5*np.pi - c0)
+        if a == 0 or t_high <= t_low:
+            return 0.0
+        if t_low == -a and t_high == a:
+            return float(a * j1(a) * cos_c0)
+        theta_low, theta_high = np.arcsin(t_low/a), np.arcsin(t_high/a)
+        half_width = 0.5*(theta_high - theta_low)
+        theta = theta_low + half_width*(_GAUSS_LEGENDRE_NODES + 1)
+        integrand = 2*np.cos(a*np.sin(theta) + c0) * (a*np.cos(theta))**2
+        return float(half_width*np.sum(_GAUSS_LEGENDRE_WEIGHTS*integrand)/(2*np.pi))
 
     def age(self, time: Quantity) -> None:
         """
@@ -291,30 +524,56 @@ class StarSpot:
         the maximum area (`area_max`), the `area_current` attribute is set to zero.
         Otherwise, it updates the `area_current` attribute accordingly.
         """
+        time = time.to_value(u.day)
+        area_decay = time*self._decay_rate
         if self.is_growing:
-            tau = np.log((self.growth_rate * u.day).to(u.Unit('')) + 1)
-            if tau == 0:
-                time_to_max = np.inf*u.day
+            tau = math.log1p(self._growth_rate)
+            if tau == 0 or self._area_current == 0:
+                time_to_max = math.inf
+            elif self._area_max == 0:
+                time_to_max = -math.inf
             else:
-                time_to_max = np.log(
-                    self.area_max/self.area_current)/tau * u.day
+                time_to_max = math.log(self._area_max/self._area_current)/tau
             if time_to_max > time:
-                new_area = self.area_current * np.exp(tau * time/u.day)
-                self.area_current = new_area
-            else:
-                self.is_growing = False
-                decay_time = time - time_to_max
-                area_decay = decay_time * self.decay_rate
-                if area_decay > self.area_max:
-                    self.area_current = 0*MSH
-                else:
-                    self.area_current = self.area_max - area_decay
+                self._area_current = self._area_current*math.exp(tau*time)
+                return
+            self.is_growing = False
+            area_decay = (time - time_to_max)*self._decay_rate
+            area_start = self._area_max
         else:
-            area_decay = time * self.decay_rate
-            if area_decay > self.area_max:
-                self.area_current = 0*MSH
-            else:
-                self.area_current = self.area_current - area_decay
+            area_start = self._area_current
+        if area_decay > self._area_max:
+            self._area_current = 0.0
+        else:
+            self._area_current = area_start - area_decay
+
+    def area_trace(self, time: Quantity) -> Quantity:
+        """
+        Get the area the spot will have after aging by each of `time`.
+
+        This evaluates the same growth and decay law as ``age``, so a whole
+        light curve of areas can be computed in one call without changing
+        the state of the spot.
+
+        Parameters
+        ----------
+        time : astropy.units.Quantity
+            Times, relative to now, at which to evaluate the spot area.
+
+        Returns
+        -------
+        astropy.units.Quantity
+            The spot area at each point in `time`. Decayed spots have zero area.
+        """
+        area, _ = age_spot_area(
+            self._area_current,
+            self._area_max,
+            self._growth_rate,
+            self._decay_rate,
+            self.is_growing,
+            np.atleast_1d(time).to_value(u.day)
+        )
+        return np.maximum(area, 0)*MSH
 
 
 class SpotCollection:
@@ -340,19 +599,23 @@ class SpotCollection:
 
     Attributes
     ----------
-    spots : tuple of StarSpot objects
+    spots : list of StarSpot objects
         Series of `StarSpot` objects in the collection.
     gridmaker : CoordinateGrid object
         `CoordinateGrid` object used to calculate the grid of the stellar surface.
     """
     gridmaker: CoordinateGrid = None
+    _MAP_PIXELS_BLOCK_SIZE = 32768
+    """
+    The number of pixels ``map_pixels`` updates against every spot at once.
+    """
     def __init__(
         self,
         *spots: StarSpot,
         grid_params: Union[int,Tuple[int, int]] = (500, 1000),
         gridmaker: CoordinateGrid=None
     ):
-        self.spots = spots
+        self.spots = list(spots)
         if gridmaker is None:
             gridmaker = CoordinateGrid.new(grid_params)
         self.set_gridmaker(gridmaker)
@@ -390,8 +653,8 @@ class SpotCollection:
         if isinstance(spot, StarSpot):
             spot = [spot]
         for s in spot:
-            s.gridmaker = self.gridmaker
-        self.spots += tuple(spot)
+            s.set_gridmaker(self.gridmaker)
+        self.spots.extend(spot)
 
     def clean_spotlist(self):
         """
@@ -406,15 +669,12 @@ class SpotCollection:
         `StarSpot` objects are stored back in the `spots` attribute of
         the `SpotCollection` object.
         """
-        spots_to_keep = []
-        for spot in self.spots:
-            if (spot.area_current <= 0*MSH) and (not spot.is_growing):
-                pass
-            else:
-                spots_to_keep.append(spot)
-        self.spots = spots_to_keep
+        self.spots = [
+            spot for spot in self.spots
+            if not (spot._area_current <= 0 and not spot.is_growing)
+        ]
 
-    def map_pixels(self, star_rad: Quantity, star_teff: Quantity):
+    def map_pixels(self, star_rad: Quantity, star_teff: Quantity, out: np.ndarray = None):
         """
         Map latitude and longitude points containing the umbra and penumbra
         of each spot. For pixels with coverage from multiple spots, assign
@@ -430,24 +690,53 @@ class SpotCollection:
             Radius of the star.
         star_teff : astropy.units.Quantity
             Temperature of the star.
+        out : np.ndarray, optional
+            A float array with the shape of ``gridmaker.zeros()`` to write the
+            map into, such as a buffer from ``gridmaker.acquire()``. The returned
+            Quantity is a view of it. If None, a new array is allocated.
 
         Returns
         -------
         surface_map : array of astropy.units.Quantity , shape(M,N)
             Map of the stellar surface with Teff assigned to each pixel
         """
-        surface_map = self.gridmaker.zeros()*star_teff.unit + star_teff
+        unit = star_teff.unit
+        surface_map = self.gridmaker.zeros() if out is None else out
+        surface_map.fill(star_teff.to_value(unit))
+        StarSpot.compute_r(self.spots, self.gridmaker)
+        spots = []
         for spot in self.spots:
-            teff_dict = spot.map_pixels(star_rad)
-            # penumbra
-            penumbra = teff_dict[spot.teff_penumbra] & (
-                surface_map > spot.teff_penumbra)
-            # umbra
-            umbra = teff_dict[spot.teff_umbra] & (
-                surface_map > spot.teff_umbra)
-            surface_map = np.where(umbra, spot.teff_umbra, np.where(
-                penumbra, spot.teff_penumbra, surface_map))
-        return surface_map
+            spots.append((
+                spot._r,
+                *spot._radii(star_rad),
+                # indexed by the number of radii a pixel is inside of
+                np.array([np.inf, spot.teff_penumbra.to_value(unit),
+                         spot.teff_umbra.to_value(unit)], dtype=surface_map.dtype)
+            ))
+        # apply every spot to one block of rows while it is still in cache
+        row_size = int(np.prod(surface_map.shape[1:]))
+        block_rows = max(1, self._MAP_PIXELS_BLOCK_SIZE // row_size)
+        block_shape = (block_rows,) + surface_map.shape[1:]
+        in_penumbra = np.empty(block_shape, dtype=bool)
+        in_umbra = np.empty(block_shape, dtype=bool)
+        code = np.empty(block_shape, dtype=np.uint8)
+        spot_teff = np.empty(block_shape, dtype=surface_map.dtype)
+        for start in range(0, surface_map.shape[0], block_rows):
+            block = slice(start, start+block_rows)
+            tile = surface_map[block]
+            n_rows = tile.shape[0]
+            tile_penumbra, tile_umbra = in_penumbra[:n_rows], in_umbra[:n_rows]
+            tile_code, tile_teff = code[:n_rows], spot_teff[:n_rows]
+            for r, radius, radius_umbra, teff_lookup in spots:
+                # the Teff this spot would give each pixel, inf outside of it
+                np.less(r[block], radius, out=tile_penumbra)
+                np.less(r[block], radius_umbra, out=tile_umbra)
+                # the umbra is larger than the spot if area_over_umbra_area < 1
+                tile_penumbra |= tile_umbra
+                np.add(tile_penumbra, tile_umbra, out=tile_code, dtype=np.uint8)
+                np.take(teff_lookup, tile_code, out=tile_teff)
+                np.minimum(tile, tile_teff, out=tile)
+        return u.Quantity(surface_map, unit, copy=False)
 
     def age(self, time: Quantity) -> None:
         """
@@ -460,9 +749,25 @@ class SpotCollection:
         time : astropy.units.Quantity
             Length of time to age the spot. For most realistic
             behavior, time should be << spot lifetime.
+
+        Notes
+        -----
+        This applies the same growth and decay law as ``StarSpot.age``, but
+        to every spot at once. The state of each spot is gathered into arrays,
+        updated, and written back.
         """
-        for spot in self.spots:
-            spot.age(time)
+        if len(self.spots) > 0:
+            area_current, is_growing = age_spot_area(
+                np.array([spot._area_current for spot in self.spots]),
+                np.array([spot._area_max for spot in self.spots]),
+                np.array([spot._growth_rate for spot in self.spots]),
+                np.array([spot._decay_rate for spot in self.spots]),
+                np.array([spot.is_growing for spot in self.spots], dtype=bool),
+                time.to_value(u.day)
+            )
+            for spot, area, growing in zip(self.spots, area_current.tolist(), is_growing.tolist()):
+                spot._area_current = area
+                spot.is_growing = growing
         self.clean_spotlist()
 
     def get_coverage(
@@ -482,11 +787,32 @@ class SpotCollection:
         coverage : float
             The fraction of the stellar surface covered by spots.
         """
-        teff_star = np.inf*u.K
         area = self.gridmaker.area
-        tmap = self.map_pixels(r_star, teff_star)
-        is_spot = tmap != teff_star
-        return np.sum(area*is_spot)/np.sum(area)
+        is_spot = self._coverage_mask(r_star)
+        return np.sum(area, where=is_spot, dtype=np.float64)/np.sum(area, dtype=np.float64)
+
+    def _coverage_mask(self, r_star: u.Quantity) -> np.ndarray:
+        """
+        Get the points covered by any spot, umbra or penumbra.
+
+        Parameters
+        ----------
+        r_star : astropy.units.Quantity
+            The radius of the star.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array that is True where a point is inside a spot.
+        """
+        StarSpot.compute_r(self.spots, self.gridmaker)
+        is_spot = self.gridmaker.zeros(dtype=bool)
+        in_spot = np.empty_like(is_spot)
+        for spot in self.spots:
+            # the umbra is larger than the spot if area_over_umbra_area < 1
+            np.less(spot._r, max(spot._radii(r_star)), out=in_spot)
+            is_spot |= in_spot
+        return is_spot
 
 
 class SpotGenerator:
@@ -595,6 +921,8 @@ class SpotGenerator:
         else:
             self.gridmaker = gridmaker
         self.rng = rng
+        self._birth_rate_params: tuple = None
+        self._birth_rate_cache: float = None
     @classmethod
     def off(
         cls,
@@ -619,7 +947,7 @@ class SpotGenerator:
             dist_area_logsigma=1,
             umbra_teff=0*u.K,
             penumbra_teff=0*u.K,
-            growth_rate=0*u.day,
+            growth_rate=0/u.day,
             decay_rate=0*MSH/u.day,
             init_area=10*MSH,
             distribution='iso',
@@ -734,27 +1062,29 @@ class SpotGenerator:
         new_max_areas = self.rng.lognormal(mean=np.log(
             self.dist_area_mean/MSH), sigma=self.dist_area_logsigma, size=n_spots)*MSH
         new_area_ratio = self.rng.normal(loc=5, scale=1, size=n_spots)
-        while np.any(new_area_ratio <= 0):
-            new_area_ratio = self.rng.normal(loc=5, scale=1, size=n_spots)
+        # redraw only the non-physical ratios, i.e. sample a truncated normal
+        bad = new_area_ratio <= 0
+        while np.any(bad):
+            new_area_ratio[bad] = self.rng.normal(loc=5, scale=1, size=np.count_nonzero(bad))
+            bad = new_area_ratio <= 0
         lat, lon = self.get_coordinates(n_spots)
 
         penumbra_teff = self.penumbra_teff
         umbra_teff = self.umbra_teff
 
-        spots = []
-        for i in range(n_spots):
-            spots.append(StarSpot(
-                lat[i], lon[i],
-                new_max_areas[i],
-                self.init_area,
-                umbra_teff, penumbra_teff,
-                growth_rate=self.growth_rate,
-                decay_rate=self.decay_rate,
-                area_over_umbra_area=new_area_ratio[i],
-                grid_params = self.grid_params,
-                gridmaker=self.gridmaker
-            ))
-        return tuple(spots)
+        if n_spots == 0:
+            return tuple()
+        return StarSpot.from_arrays(
+            lat, lon,
+            new_max_areas,
+            self.init_area,
+            umbra_teff, penumbra_teff,
+            growth_rate=self.growth_rate,
+            decay_rate=self.decay_rate,
+            area_over_umbra_area=new_area_ratio,
+            grid_params=self.grid_params,
+            gridmaker=self.gridmaker
+        )
 
     def get_n_spots_to_birth(self, time: Quantity, rad_star: Quantity) -> float:
         """
@@ -774,10 +1104,30 @@ class SpotGenerator:
         N_exp : float
             Expected number of new `StarSpot` objects.
         """
-        n_expected = (self.coverage * 4*np.pi*rad_star**2 / self.mean_area *
-                 time / self.mean_lifetime).to_value(u.dimensionless_unscaled)
+        n_expected = (self.coverage * 4*np.pi*rad_star.to_value(u.km)**2
+                      * time.to_value(u.day) * self._birth_rate)
         return n_expected
 
+    @property
+    def _birth_rate(self) -> float:
+        """
+        The rate at which spots are born per unit of spotted area,
+        ``1/(mean_area*mean_lifetime)``, in km-2 day-1.
+
+        It is cached until the value of one of the spot parameters changes.
+        """
+        params = (
+            self.dist_area_mean.to_value(MSH),
+            self.init_area.to_value(MSH),
+            self.growth_rate.to_value(1/u.day),
+            self.decay_rate.to_value(MSH/u.day)
+        )
+        if self._birth_rate_params != params:
+            self._birth_rate_cache = float(
+                (1/(self.mean_area*self.mean_lifetime)).to_value(1/(u.km**2*u.day)))
+            self._birth_rate_params = params
+        return self._birth_rate_cache
+
     def birth_spots(self, time: Quantity, rad_star: Quantity) -> tuple[StarSpot]:
         """
         Generate new `StarSpot` objects to be birthed over a given time duration.
@@ -24,7 +24,7 @@ from astropy.units.quantity import Quantity
 
 from vspec_vsm.coordinate_grid import CoordinateGrid
 from vspec_vsm.helpers import (
-    get_angle_between, proj_ortho,
+    get_angle_between,
     calc_circ_fraction_inside_unit_circle,
     clip_teff
 )
@@ -100,6 +100,20 @@ class Star:
     u2 : float
         Limb-darkening parameter u2.
     """
+    DTYPE = np.float32
+    """
+    The data type of per-pixel maps such as ``mu``. Sums over
+    the grid are always accumulated in double precision.
+    """
+    _TRANSIT_CHUNK_SIZE = 64
+    """
+    The number of partly covered pixels whose overlap with the planet
+    is integrated at once by ``_transit_masks``.
+    """
+    CACHE_SIZE = 8
+    """
+    The number of geometry arrays, such as ``mu``, kept by ``get_mu`` and ``get_ld_weight``.
+    """
 
     def __init__(self, teff: u.Quantity,
                  radius: u.Quantity,
@@ -169,6 +183,8 @@ class Star:
             self.granulation = granulation
         self.u1 = u1
         self.u2 = u2
+        self._cache = {}
+        self._cache_grid: CoordinateGrid = None
         self.set_spot_grid()
         self.set_fac_grid()
 
@@ -209,7 +225,13 @@ class Star:
             Length of time to age the features on the stellar surface.
             For most realistic behavior, `time` should be much less than
             spot or faculae lifetime.
+
+        Notes
+        -----
+        If `time` is zero the surface is left untouched.
         """
+        if time.to_value(u.s) == 0:
+            return
         self.spots.age(time)
         self.faculae.age(time)
 
@@ -236,6 +258,38 @@ class Star:
         """
         self.faculae.add_faculae(facula)
 
+    def _cached(self, key: tuple, func) -> np.ndarray:
+        """
+        Look up an array in the cache of this star, computing it if needed.
+
+        Parameters
+        ----------
+        key : tuple
+            A hashable description of the array.
+        func : callable
+            Function with no arguments that computes the array.
+
+        Returns
+        -------
+        np.ndarray
+            The cached array. It is read-only because it is shared between calls.
+
+        Notes
+        -----
+        At most ``CACHE_SIZE`` arrays are kept, and the oldest is dropped first.
+        The cache is cleared whenever ``gridmaker`` is replaced.
+        """
+        if self._cache_grid is not self.gridmaker:
+            self._cache.clear()
+            self._cache_grid = self.gridmaker
+        if key not in self._cache:
+            if len(self._cache) >= self.CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            arr = func()
+            arr.setflags(write=False)
+            self._cache[key] = arr
+        return self._cache[key]
+
     def get_mu(self, lat0: u.Quantity, lon0: u.Quantity) -> np.ndarray:
         """
         Get the cosine of the angle from disk center.
@@ -251,10 +305,42 @@ class Star:
         -------
         mu : np.ndarray
             An array of cos(x) where x is
-            the angle from disk center.
+            the angle from disk center. This array
+            is cached and must not be modified.
+
+        """
+        key = ('mu', lat0.to_value(u.deg), lon0.to_value(u.deg))
+        return self._cached(
+            key, lambda: self.gridmaker.cos_angle_from_disk_center(
+                lat0, lon0).astype(self.DTYPE, copy=False))
 
+    def get_ld_weight(self, lat0: u.Quantity, lon0: u.Quantity) -> np.ndarray:
         """
-        return self.gridmaker.cos_angle_from_disk_center(lat0, lon0)
+        Get the contribution of each point to the flux of the disk.
+
+        This is the product of the limb-darkening mask, the projected area
+        and the relative area of each point.
+
+        Parameters
+        ----------
+        lat0 : astropy.units.Quantity
+            The sub-observer latitude.
+        lon0 : astropy.units.Quantity
+            The sub-observer longitude
+
+        Returns
+        -------
+        weight : np.ndarray
+            The weight of each point. This array
+            is cached and must not be modified.
+        """
+        def func():
+            mu = self.get_mu(lat0, lon0)
+            ld = self.ld_mask_for_plotting(mu)
+            proj_area = self.get_jacobian()*self.area_projection_coefficient(mu)
+            return ld*proj_area.astype(self.DTYPE, copy=False)
+        key = ('ld', lat0.to_value(u.deg), lon0.to_value(u.deg), self.u1, self.u2)
+        return self._cached(key, func)
 
     def ld_mask(self, mu) -> np.ndarray:
         """
@@ -323,7 +409,8 @@ class Star:
     def add_faculae_to_map(
         self,
         lat0: u.Quantity,
-        lon0: u.Quantity
+        lon0: u.Quantity,
+        out: np.ndarray = None
     ):
         """
         Add the faculae to the surface map.
@@ -334,18 +421,22 @@ class Star:
             The sub-observer latitude.
         lon0 : astropy.units.Quantity
             The sub-observer longitude.
+        out : np.ndarray, optional
+            A buffer to write the map into. See ``SpotCollection.map_pixels``.
 
         Returns
         -------
         teffmap : astropy.units.Quantity
             A temperature map of the surface
         """
-        map_from_spots = self.map
+        map_from_spots = self.spots.map_pixels(self.radius, self.teff, out=out)
         mu = self.get_mu(lat0, lon0)
         faculae: Tuple[Facula] = self.faculae.faculae
+        inside_fac = np.empty(map_from_spots.shape, dtype=bool)
         for facula in faculae:
+            rad = facula.angular_radius(self.radius).to_value(u.rad)
+            np.less_equal(facula._r_rad(), rad, out=inside_fac)
             angle = get_angle_between(lat0, lon0, facula.lat, facula.lon)
-            inside_fac = facula.map_pixels(self.radius)
             if not np.any(inside_fac):  # the facula is too small
                 pass
             else:
@@ -425,74 +516,208 @@ class Star:
         pl_frac : float
             The fraction of the planet that is visible to the observer.
         """
-        eclipse = False
-        if np.cos(phase) > 0:
-            eclipse = True
-        angle_past_midtransit: u.Quantity = phase - 180*u.deg
-        x: float = (orbit_radius/self.radius * np.sin(angle_past_midtransit)
-             ).to_value(u.dimensionless_unscaled)
-        y: float = (orbit_radius/self.radius * np.cos(angle_past_midtransit)
-             * np.cos(inclination)).to_value(u.dimensionless_unscaled)
-        rp_rs: float = (radius/self.radius).to_value(u.dimensionless_unscaled)
+        x, y, rp_rs = self._planet_position(orbit_radius, radius, phase, inclination)
         if np.sqrt(x**2 + y**2) > 1 + 2*rp_rs:  # no transit
             return self.gridmaker.zeros().astype('bool'), 1.0
-        elif eclipse:
+        elif np.cos(phase) > 0:  # eclipse
             planet_fraction = self.get_pl_frac(
-                angle_past_midtransit, orbit_radius, radius, inclination)
+                phase - 180*u.deg, orbit_radius, radius, inclination)
             return self.gridmaker.zeros().astype('bool'), planet_fraction
         else:
-            llat, llon = self.gridmaker.grid()
-            xcoord, ycoord = proj_ortho(lat0, lon0, llat, llon)
-            mu = self.gridmaker.cos_angle_from_disk_center(lat0, lon0)
-            area = self.gridmaker.area  # area in units of 4pi steradians ie adds to 1
-            point_radii = 2*np.sqrt(area)  # radius of each pixel in radians. The 2
-                                           # comes from the 4 in 4pi steradians
-            proj_radii = point_radii*mu  # radius of each pixel in projected coords
-            # distances in projected coords
-            rad_map = np.sqrt((xcoord-x)**2 + (ycoord-y)**2)
-            # case 1: Point is completely outside transit radius
-            case1 = (rad_map > rp_rs + 2*proj_radii) | np.isnan(rad_map)
-
-            covered_value = np.where(~case1, 1, 0).astype('float')
-            if np.any(np.isnan(covered_value)):
-                raise ValueError('NaN in covered_value')
-            indicies = np.argwhere(~case1)
-            if len(indicies)>0:
-                relevent_radii = proj_radii[~case1]
-                rad_mean = np.mean(relevent_radii)
-                if rad_mean > 0.5*rp_rs:
-                    area_mean = np.pi*rad_mean**2
-                    area_pl = np.pi*rp_rs**2
-                    target_area = area_pl/4
-                    factor = area_mean/target_area
-                    
-                    warnings.warn(
-                        f'Pixel resolution too low. Increase by factor of {factor:.2f}',
-                        InsufficientResolutionWarning
-                    )
-                    
-            for index in indicies:
-                s = index if index is int else tuple(index)
-                dist_from_transit_center: float = rad_map[s]
-                # gauss_sigma = proj_radii[s]
-                sigma_x = point_radii[s]*mu[s]
-                sigma_y = point_radii[s]
-                if rp_rs > dist_from_transit_center+2*sigma_x:
-                    covered_value[s] = 1.
-                else:
-                    x = np.linspace(-3*sigma_x, 3*sigma_x, 100)
-                    xx, yy = np.meshgrid(x, x)
-                    # zz = 1/(2*np.pi*gauss_sigma**2)*np.exp(-(xx**2 + yy**2)
-                    #                                        / (2*gauss_sigma**2))
-                    zz = 1/(2*np.pi*sigma_x*sigma_y)*np.exp(-0.5*(xx/sigma_x)**2 - 0.5*(yy/sigma_y)**2)
-                    dist = np.sqrt((xx-dist_from_transit_center)**2 + (yy)**2)
-                    overlap = np.where(dist < rp_rs, zz, 0)
-                    overlap = np.trapz(overlap, x, axis=1)
-                    overlap = np.trapz(overlap, x, axis=0)
-                    covered_value[s] = overlap
-            if np.any(np.isnan(covered_value)):
-                raise ValueError('NaN in covered_value')
-            return covered_value, 1.0
+            geometry = self._transit_geometry(lat0, lon0)
+            return self._transit_masks([x], [y], [rp_rs], *geometry)[0], 1.0
+
+    def get_transit_masks(
+        self,
+        lat0: u.Quantity,
+        lon0: u.Quantity,
+        orbit_radius: u.Quantity,
+        radius: u.Quantity,
+        phase: u.Quantity,
+        inclination: u.Quantity
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get transit masks for many planet configurations seen from one
+        sub-observer point.
+
+        The masks of every configuration where the planet is in front of the
+        star are computed together in one broadcast step. Every other
+        configuration gets the same mask of zeros, so only transits allocate
+        a mask. All masks have dtype ``DTYPE`` and are read-only.
+
+        Parameters
+        ----------
+        lat0 : astropy.units.Quantity
+            The sub-observer latitude.
+        lon0 : astropy.units.Quantity
+            The sub-observer longitude.
+        orbit_radius : astropy.units.Quantity
+            The radius of the planet's orbit.
+        radius : astropy.units.Quantity
+            The radius of the planet.
+        phase : astropy.units.Quantity
+            The phase of the planet. 180 degrees is mid transit.
+        inclination : astropy.units.Quantity
+            The inclination of the planet. 90 degrees is transiting.
+
+        Returns
+        -------
+        masks : list of np.ndarray
+            The fraction of each pixel that is covered by the planet, for each
+            of the ``K`` configurations given by broadcasting `orbit_radius`,
+            `radius`, `phase`, and `inclination`.
+        pl_frac : np.ndarray, shape=(K,)
+            The fraction of the planet that is visible to the observer.
+
+        Raises
+        ------
+        ValueError
+            If the planet parameters do not broadcast to a 1D array.
+        """
+        orbit_radius, radius, phase, inclination = np.broadcast_arrays(
+            orbit_radius, radius, phase, inclination, subok=True)
+        if phase.ndim != 1:
+            raise ValueError('Planet parameters must be scalars or 1D arrays.')
+        x, y, rp_rs = self._planet_position(orbit_radius, radius, phase, inclination)
+        transiting = np.sqrt(x**2 + y**2) <= 1 + 2*rp_rs
+        eclipse = transiting & (np.cos(phase) > 0)
+        no_transit = self.gridmaker.zeros(dtype=self.DTYPE)
+        no_transit.setflags(write=False)
+        masks = [no_transit]*len(phase)
+        pl_frac = np.ones(len(phase))
+        for k in np.flatnonzero(eclipse):
+            pl_frac[k] = self.get_pl_frac(
+                phase[k] - 180*u.deg, orbit_radius[k], radius[k], inclination[k])
+        in_front = np.flatnonzero(transiting & ~eclipse)
+        if len(in_front) > 0:
+            geometry = self._transit_geometry(lat0, lon0)
+            covered = self._transit_masks(
+                x[in_front], y[in_front], rp_rs[in_front], *geometry)
+            covered.setflags(write=False)
+            for k, mask in zip(in_front, covered):
+                masks[k] = mask
+        return masks, pl_frac
+
+    def _planet_position(
+        self,
+        orbit_radius: u.Quantity,
+        radius: u.Quantity,
+        phase: u.Quantity,
+        inclination: u.Quantity
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the projected position and radius of the planet in units of the stellar radius.
+        """
+        angle_past_midtransit: u.Quantity = phase - 180*u.deg
+        x = (orbit_radius/self.radius * np.sin(angle_past_midtransit)
+             ).to_value(u.dimensionless_unscaled)
+        y = (orbit_radius/self.radius * np.cos(angle_past_midtransit)
+             * np.cos(inclination)).to_value(u.dimensionless_unscaled)
+        rp_rs = (radius/self.radius).to_value(u.dimensionless_unscaled)
+        return x, y, rp_rs
+
+    def _transit_geometry(
+        self,
+        lat0: u.Quantity,
+        lon0: u.Quantity
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the projected coordinates, ``mu``, and the radius of each pixel,
+        which do not depend on the planet.
+        """
+        xcoord, ycoord = self.gridmaker.project_ortho(lat0, lon0)
+        mu = self.get_mu(lat0, lon0)
+        area = self.gridmaker.area  # area in units of 4pi steradians ie adds to 1
+        point_radii = 2*np.sqrt(area)  # radius of each pixel in radians. The 2
+                                       # comes from the 4 in 4pi steradians
+        return xcoord, ycoord, mu, point_radii
+
+    def _transit_masks(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        rp_rs: np.ndarray,
+        xcoord: np.ndarray,
+        ycoord: np.ndarray,
+        mu: np.ndarray,
+        point_radii: np.ndarray
+    ) -> np.ndarray:
+        """
+        Get the fraction of each pixel covered by a planet in front of the star,
+        for ``K`` planet positions at once.
+
+        `x`, `y`, and `rp_rs` have shape (K,). The result has shape
+        ``(K,) + xcoord.shape``.
+        """
+        expand = (slice(None),) + (np.newaxis,)*xcoord.ndim
+        x, y, rp_rs = np.asarray(x)[expand], np.asarray(y)[expand], np.asarray(rp_rs)[expand]
+        proj_radii = point_radii*mu  # radius of each pixel in projected coords
+        # distances in projected coords
+        rad_map = np.sqrt((xcoord-x)**2 + (ycoord-y)**2)
+        # case 1: Point is completely outside transit radius
+        case1 = (rad_map > rp_rs + 2*proj_radii) | np.isnan(rad_map)
+
+        covered_value = np.where(~case1, 1, 0).astype(self.DTYPE)
+        near = ~case1
+        n_near = np.sum(near, axis=tuple(range(1, near.ndim)))
+        if np.any(n_near > 0):
+            rad_sum = np.sum(np.where(near, proj_radii, 0), axis=tuple(range(1, near.ndim)))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                rad_mean = rad_sum/n_near
+            rp_flat = rp_rs.reshape(-1)
+            for k in np.flatnonzero((n_near > 0) & (rad_mean > 0.5*rp_flat)):
+                area_mean = np.pi*rad_mean[k]**2
+                area_pl = np.pi*rp_flat[k]**2
+                target_area = area_pl/4
+                factor = area_mean/target_area
+
+                warnings.warn(
+                    f'Pixel resolution too low. Increase by factor of {factor:.2f}',
+                    InsufficientResolutionWarning
+                )
+
+        # pixels near the limb of the planet are integrated numerically
+        index = np.nonzero(near)
+        pixel = index[1:]
+        dist_from_transit_center = rad_map[index]
+        sigma_x = np.broadcast_to(proj_radii, covered_value.shape[1:])[pixel]
+        sigma_y = np.broadcast_to(point_radii, covered_value.shape[1:])[pixel]
+        rp = rp_rs.reshape(-1)[index[0]]
+        inside = rp > dist_from_transit_center + 2*sigma_x
+        partial = np.flatnonzero(~inside)
+        overlap = np.ones(len(dist_from_transit_center), dtype=self.DTYPE)
+        # bound the size of the (n, 100, 100) integration arrays
+        for start in range(0, len(partial), self._TRANSIT_CHUNK_SIZE):
+            chunk = partial[start:start+self._TRANSIT_CHUNK_SIZE]
+            overlap[chunk] = self._pixel_overlap(
+                dist_from_transit_center[chunk], sigma_x[chunk], sigma_y[chunk], rp[chunk])
+        covered_value[index] = overlap
+        if np.any(np.isnan(covered_value)):
+            raise ValueError('NaN in covered_value')
+        return covered_value
+
+    @staticmethod
+    def _pixel_overlap(
+        dist: np.ndarray,
+        sigma_x: np.ndarray,
+        sigma_y: np.ndarray,
+        rp_rs: np.ndarray
+    ) -> np.ndarray:
+        """
+        Integrate the gaussian footprint of each pixel over the disk of the planet.
+
+        All arguments have shape (n,).
+        """
+        x = np.linspace(-3, 3, 100)*sigma_x[:, np.newaxis]  # (n, 100)
+        sigma_x = sigma_x[:, np.newaxis, np.newaxis]
+        sigma_y = sigma_y[:, np.newaxis, np.newaxis]
+        xx = x[:, np.newaxis, :]
+        yy = x[:, :, np.newaxis]
+        zz = 1/(2*np.pi*sigma_x*sigma_y)*np.exp(-0.5*(xx/sigma_x)**2 - 0.5*(yy/sigma_y)**2)
+        dist = np.sqrt((xx-dist[:, np.newaxis, np.newaxis])**2 + (yy)**2)
+        overlap = np.where(dist < rp_rs[:, np.newaxis, np.newaxis], zz, 0)
+        overlap = np.trapz(overlap, xx, axis=2)
+        return np.trapz(overlap, x, axis=1)
 
     def calc_coverage(
         self,
@@ -530,15 +755,8 @@ class Star:
         pl_frac : float
             The fraction of the planet that is visble. This is in case of an eclipse.
         """
-        cos_c = self.get_mu(sub_obs_coords['lat'], sub_obs_coords['lon'])
-        # ld = self.ld_mask(cos_c)
-        ld = self.ld_mask_for_plotting(cos_c)
-        
-        jacobian = self.get_jacobian()
-        proj_area = jacobian*self.area_projection_coefficient(cos_c)
+        weight = self.get_ld_weight(sub_obs_coords['lat'], sub_obs_coords['lon'])
 
-        surface_map = self.add_faculae_to_map(
-            sub_obs_coords['lat'], sub_obs_coords['lon'])
         covered, pl_frac = self.get_transit_mask(
             sub_obs_coords['lat'], sub_obs_coords['lon'],
             orbit_radius=orbit_radius,
@@ -547,14 +765,23 @@ class Star:
             inclination=inclination
         )
 
-        teffs = np.unique(surface_map)
+        # the map is only needed until it is reduced, so reuse a pooled buffer
+        buffer = self.gridmaker.acquire()
+        try:
+            surface_map = self.add_faculae_to_map(
+                sub_obs_coords['lat'], sub_obs_coords['lon'], out=buffer)
+            values, index = np.unique(surface_map.value, return_inverse=True)
+            teffs = values*surface_map.unit
+        finally:
+            self.gridmaker.release(buffer)
+        index = index.ravel()
+        # bincount sums the weight of every Teff in one pass, in double precision
+        nominal_areas = np.bincount(index, weights=weight.ravel(), minlength=len(teffs))
+        covered_areas = np.bincount(index, weights=(weight*covered).ravel(), minlength=len(teffs))
         total_data = {}
         covered_data = {}
-        total_area = np.sum(ld*proj_area)
-        for teff in teffs:
-            pix_has_teff = np.where(surface_map == teff, 1, 0)
-            nominal_area = np.sum(pix_has_teff*ld*proj_area)
-            covered_area = np.sum(pix_has_teff*ld*proj_area*(covered))
+        total_area = np.sum(nominal_areas)
+        for teff, nominal_area, covered_area in zip(teffs, nominal_areas, covered_areas):
             total_data[f'{teff:.2f}'] = nominal_area/total_area
             covered_data[f'{teff:.2f}'] = covered_area/total_area
         granulation_teff = self.teff - self.granulation.dteff